@@ -5,15 +5,42 @@ This module provides centralized database loading functionality for the
 lexical databases used by example generation.
 """
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+from build.utils.common_utils import load_json_file
 from build.utils.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
 
+def _read_database(
+    db_type: str, filepath: Path
+) -> Tuple[Dict, Optional[Tuple[int, str]]]:
+    """
+    Read one lexical database file.
+
+    Problems are returned rather than logged so that databases read
+    concurrently still report them in a deterministic order.
+
+    Returns:
+        Tuple of (database content, optional (log level, message))
+    """
+    try:
+        data = load_json_file(filepath)
+    except FileNotFoundError:
+        return {}, (logging.ERROR, f"Database file not found: {filepath}")
+    except Exception as e:
+        return {}, (logging.ERROR, f"Could not load {filepath.name}: {e}")
+
+    # Extract the actual database content
+    if db_type in data:
+        return data[db_type], None
+    return {}, (logging.WARNING, f"No '{db_type}' key found in {filepath.name}")
+
+
 class DatabaseLoader:
     """Centralized database loading utility."""
 
@@ -72,25 +99,14 @@ class DatabaseLoader:
             ("surface_nouns", self.config.get_path("surface_noun_database")),
         ]
 
-        for db_type, filepath in db_files:
-            if filepath.exists():
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        # Extract the actual database content
-                        if db_type in data:
-                            self._databases[db_type] = data[db_type]
-                        else:
-                            self._databases[db_type] = {}
-                            logger.warning(
-                                f"No '{db_type}' key found in {filepath.name}"
-                            )
-                except Exception as e:
-                    logger.error(f"Could not load {filepath.name}: {e}")
-                    self._databases[db_type] = {}
-            else:
-                logger.error(f"Database file not found: {filepath}")
-                self._databases[db_type] = {}
+        # The files are independent, so read them concurrently
+        with ThreadPoolExecutor(max_workers=len(db_files)) as executor:
+            results = list(executor.map(lambda entry: _read_database(*entry), db_files))
+
+        for (db_type, _filepath), (database, problem) in zip(db_files, results):
+            self._databases[db_type] = database
+            if problem is not None:
+                logger.log(*problem)
 
         self._loaded = True
         return self._databases.copy()
@@ -188,14 +204,18 @@ class DatabaseLoader:
         return info
 
 
+@lru_cache(maxsize=None)
+def _get_loader(data_dir: Optional[Path] = None) -> DatabaseLoader:
+    """Return one loader per data directory so its databases are read from disk once."""
+    return DatabaseLoader(data_dir)
+
+
 # Convenience functions for backward compatibility [LEGACY]
 def load_all_databases(data_dir: Optional[Path] = None) -> Dict[str, Dict]:
     """Convenience function to load all databases."""
-    loader = DatabaseLoader(data_dir)
-    return loader.load_all_databases()
+    return _get_loader(data_dir).load_all_databases()
 
 
 def get_database(db_type: str, data_dir: Optional[Path] = None) -> Dict:
     """Convenience function to get a specific database."""
-    loader = DatabaseLoader(data_dir)
-    return loader.get_database(db_type)
+    return _get_loader(data_dir).get_database(db_type)
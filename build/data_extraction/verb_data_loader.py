@@ -4,9 +4,12 @@ Handles JSON data loading, validation, and preprocessing for Georgian verb data.
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
+from build.utils.common_utils import get_primary_verb as utils_get_primary_verb
+from build.utils.common_utils import load_json_file
 from build.utils.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
@@ -26,6 +29,11 @@ class VerbDataLoader:
         self._cached_data = None
         self._last_modified = None
 
+    def invalidate_cache(self):
+        """Drop cached verb data so the next load re-reads verbs.json."""
+        self._cached_data = None
+        self._last_modified = None
+
     def load_json_data(self) -> Tuple[List[Dict], Dict]:
         """
         Load verb data from JSON file and return processed data.
@@ -35,40 +43,33 @@ class VerbDataLoader:
             Tuple of (verbs_list, duplicate_primary_verbs_dict)
         """
         try:
-            if not self.verbs_file.exists():
-                logger.error(f"Verbs file not found: {self.verbs_file}")
-                return [], {}
-
-            # Simple cache check
-            current_modified = self.verbs_file.stat().st_mtime
+            # A single stat both checks existence and keys the cache
+            stat = self.verbs_file.stat()
+            current_modified = (stat.st_mtime_ns, stat.st_size)
             if self._cached_data and self._last_modified == current_modified:
                 logger.info("Using cached verb data (file unchanged)")
-                return self._cached_data
+                verbs, duplicate_primary_verbs = self._cached_data
+                return list(verbs), dict(duplicate_primary_verbs)
 
             # Load fresh data
             logger.info("Loading fresh verb data from file")
-            with open(self.verbs_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Get verbs data
-            verbs_data = data.get("verbs", {})
+            data = load_json_file(self.verbs_file)
 
             # Convert verbs_data to list of verbs
-            verbs = list(verbs_data.values())
+            verbs = list(data.get("verbs", {}).values())
 
-            # Validate verb data
-            if not self.validate_verb_data(verbs):
+            # Validate verb data and identify duplicate primary verbs for
+            # smart disambiguation in one pass
+            duplicate_keys, duplicate_primary_verbs = self._scan_verbs(verbs)
+            if not self._report_validation(duplicate_keys):
                 logger.warning("Verb data validation failed")
 
-            # Identify duplicate primary verbs for smart disambiguation
-            duplicate_primary_verbs = self.get_duplicate_primary_verbs(verbs)
-
-            # Cache the results
+            # Cache the results; callers get their own list and dict copies
             self._cached_data = (verbs, duplicate_primary_verbs)
             self._last_modified = current_modified
 
             logger.info(f"Successfully loaded {len(verbs)} verbs (cached)")
-            return verbs, duplicate_primary_verbs
+            return list(verbs), dict(duplicate_primary_verbs)
 
         except FileNotFoundError:
             logger.error(f"Verbs file not found: {self.verbs_file}")
@@ -80,41 +81,79 @@ class VerbDataLoader:
             logger.error(f"Unexpected error loading verbs data: {e}")
             return [], {}
 
-    def validate_verb_data(self, verbs: List[Dict]) -> bool:
+    def _scan_verbs(
+        self, verbs: List[Dict]
+    ) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
         """
-        Validate verb data for uniqueness and consistency.
+        Check semantic keys and count primary verbs in a single pass.
 
         Args:
             verbs: List of verb dictionaries
 
         Returns:
-            True if validation passes, False otherwise
+            Tuple of (duplicate (semantic_key, georgian) pairs,
+            duplicate primary verbs and their counts)
         """
         semantic_keys = set()
-        warnings = []
+        duplicate_keys = []
+        primary_verb_counts = Counter()
+        get_primary_verb = self.get_primary_verb
 
         for verb in verbs:
-            semantic_key = verb.get("semantic_key", "")
+            get = verb.get
+            semantic_key = get("semantic_key", "")
             if semantic_key in semantic_keys:
-                warnings.append(f"Warning: Duplicate semantic key: {semantic_key}")
-                logger.warning(
-                    f"Duplicate semantic key '{semantic_key}' found for verb: {verb.get('georgian', 'N/A')}"
-                )
+                duplicate_keys.append((semantic_key, get("georgian", "N/A")))
             semantic_keys.add(semantic_key)
+            primary_verb_counts[get_primary_verb(get("georgian", ""))] += 1
 
-        for warning in warnings:
-            logger.warning(warning)
+        # Keep only the verbs that appear more than once
+        duplicate_primary_verbs = {
+            verb: count for verb, count in primary_verb_counts.items() if count > 1
+        }
+        return duplicate_keys, duplicate_primary_verbs
+
+    def _report_validation(self, duplicate_keys: List[Tuple[str, str]]) -> bool:
+        """
+        Log the outcome of semantic key validation.
+
+        Args:
+            duplicate_keys: Duplicate (semantic_key, georgian) pairs
+
+        Returns:
+            True if validation passed, False otherwise
+        """
+        for semantic_key, georgian in duplicate_keys:
+            logger.warning(
+                f"Duplicate semantic key '{semantic_key}' found for verb: {georgian}"
+            )
+        for semantic_key, _georgian in duplicate_keys:
+            logger.warning(f"Warning: Duplicate semantic key: {semantic_key}")
 
-        validation_passed = len(warnings) == 0
+        warning_count = len(duplicate_keys)
+        validation_passed = warning_count == 0
         if not validation_passed:
             logger.warning(
-                f"⚠️ Verb data validation failed with {len(warnings)} warnings"
+                f"⚠️ Verb data validation failed with {warning_count} warnings"
             )
         else:
             logger.info("✅ Verb data validation passed")
 
         return validation_passed
 
+    def validate_verb_data(self, verbs: List[Dict]) -> bool:
+        """
+        Validate verb data for uniqueness and consistency.
+
+        Args:
+            verbs: List of verb dictionaries
+
+        Returns:
+            True if validation passes, False otherwise
+        """
+        duplicate_keys, _ = self._scan_verbs(verbs)
+        return self._report_validation(duplicate_keys)
+
     def get_duplicate_primary_verbs(self, verbs: List[Dict]) -> Dict:
         """
         Identify primary verbs that appear multiple times (need disambiguation).
@@ -125,17 +164,8 @@ class VerbDataLoader:
         Returns:
             Dictionary of duplicate primary verbs and their counts
         """
-        primary_verb_counts = {}
-
-        for verb in verbs:
-            georgian = verb.get("georgian", "")
-            primary_verb = self.get_primary_verb(georgian)
-            primary_verb_counts[primary_verb] = (
-                primary_verb_counts.get(primary_verb, 0) + 1
-            )
-
-        # Return only the verbs that appear more than once
-        return {verb: count for verb, count in primary_verb_counts.items() if count > 1}
+        _, duplicate_primary_verbs = self._scan_verbs(verbs)
+        return duplicate_primary_verbs
 
     def get_primary_verb(self, georgian_text: str) -> str:
         """
@@ -147,6 +177,4 @@ class VerbDataLoader:
         Returns:
             Primary verb form
         """
-        from build.utils import get_primary_verb as utils_get_primary_verb
-
         return utils_get_primary_verb(georgian_text)
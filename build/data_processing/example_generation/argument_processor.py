@@ -13,9 +13,13 @@ Features:
 - Comprehensive error handling with fallbacks
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 from build.utils.shared_gloss_utils import BaseGlossParser
 from build.utils.unicode_console import safe_log
@@ -26,6 +30,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Gloss role abbreviation -> argument name
+_DEFAULT_ARGUMENT_MAPPINGS = MappingProxyType(
+    {"S": "subject", "DO": "direct_object", "IO": "indirect_object"}
+)
+
+# Whitespace-delimited gloss tokens, classified by the regex engine:
+# <S:Nom> style case specifications, other <...> argument patterns, plain words
+_GLOSS_TOKEN_RE = re.compile(
+    r"(?<!\S)(?:(?P<case_spec><\S*:\S*>)|(?P<argument_pattern><\S*>)|(?P<word>\S+))(?!\S)"
+)
+
 
 @dataclass
 class ParsedGloss:
@@ -38,6 +53,17 @@ class ParsedGloss:
     arguments: Dict[str, Dict]
 
 
+def _copy_parsed_gloss(parsed: ParsedGloss) -> ParsedGloss:
+    """Copy a ParsedGloss deeply enough that its argument dicts can be mutated."""
+    return ParsedGloss(
+        voice=parsed.voice,
+        tense=parsed.tense,
+        preverb=parsed.preverb,
+        argument_pattern=parsed.argument_pattern,
+        arguments={name: dict(info) for name, info in parsed.arguments.items()},
+    )
+
+
 @dataclass
 class ResolvedArgument:
     """Represents a fully resolved argument with all necessary data."""
@@ -51,6 +77,13 @@ class ResolvedArgument:
     case: str
 
 
+@lru_cache(maxsize=1)
+def _load_shared_databases() -> Dict:
+    """Load the lexical databases once per process; callers treat them as read-only."""
+    loader = DatabaseLoader()
+    return loader.load_all_databases()
+
+
 # Custom exception classes removed - using standard Python exceptions instead
 # ValueError for invalid data, RuntimeError for runtime issues
 
@@ -72,8 +105,7 @@ class ArgumentProcessor(BaseGlossParser):
 
         # Default argument mappings
         self.argument_mappings = self.config.get(
-            "argument_mappings",
-            {"S": "subject", "DO": "direct_object", "IO": "indirect_object"},
+            "argument_mappings", _DEFAULT_ARGUMENT_MAPPINGS
         )
 
         # All cases must be explicitly specified
@@ -82,22 +114,51 @@ class ArgumentProcessor(BaseGlossParser):
             "database_names", ["subjects", "direct_objects", "indirect_objects"]
         )
 
-        # Default voice and tense configurations
-        self.valid_voices = self.config.get(
-            "valid_voices", ["Act", "Med", "Pass", "MedAct", "MedPass"]
+        # Default voice and tense configurations (interned, like the parsed
+        # tokens, so vocabulary lookups compare by identity)
+        self.valid_voices = frozenset(
+            map(
+                sys.intern,
+                self.config.get(
+                    "valid_voices", ("Act", "Med", "Pass", "MedAct", "MedPass")
+                ),
+            )
         )
 
-        self.valid_tenses = self.config.get(
-            "valid_tenses", ["Pres", "Impf", "Fut", "Aor", "Opt", "Impv", "Inv"]
+        self.valid_tenses = frozenset(
+            map(
+                sys.intern,
+                self.config.get(
+                    "valid_tenses", ("Pres", "Impf", "Fut", "Aor", "Opt", "Impv", "Inv")
+                ),
+            )
         )
 
+        # Token -> kind dispatch table for the plain (non-bracketed) gloss tokens;
+        # built in reverse precedence so earlier checks win on overlap
+        self._token_kinds = {"Pv": "preverb"}
+        self._token_kinds.update((tense, "tense") for tense in self.valid_tenses)
+        self._token_kinds.update((voice, "voice") for voice in self.valid_voices)
+        self._token_kinds["V"] = "verb"
+
+        # Argument roles of each supported pattern, resolved once up front
+        self._pattern_arguments = {
+            pattern: self._resolve_pattern_arguments(pattern)
+            for pattern in self.supported_argument_patterns
+        }
+
         # Initialize databases as None - will be loaded lazily when needed
         self._databases = None
 
+        # Successfully parsed glosses keyed by the raw gloss string
+        self._parsed_gloss_cache: Dict[str, ParsedGloss] = {}
+
+        # Glosses that failed validation, mapped to their error message
+        self._rejected_gloss_cache: Dict[str, str] = {}
+
     def _load_databases(self) -> Dict:
         """Load the four databases for validation and resolution using shared utility"""
-        loader = DatabaseLoader()
-        return loader.load_all_databases()
+        return _load_shared_databases()
 
     @property
     def databases(self) -> Dict:
@@ -119,6 +180,68 @@ class ArgumentProcessor(BaseGlossParser):
         Raises:
             ValueError: If required components are missing
         """
+        # Hand out a copy so callers can't mutate the cached argument dicts
+        return _copy_parsed_gloss(self.get_parsed_gloss(raw_gloss))
+
+    def get_parsed_gloss(self, raw_gloss: str) -> ParsedGloss:
+        """
+        Parse standardized gnc.ge format raw_gloss without copying the result
+
+        Results are memoized per raw_gloss, so the returned ParsedGloss is
+        shared and must be treated as read-only; use parse_raw_gloss for a
+        private copy.
+
+        Args:
+            raw_gloss: String in gnc.ge format
+
+        Returns:
+            Shared ParsedGloss object with structured components
+
+        Raises:
+            ValueError: If required components are missing
+        """
+        cached = self._parsed_gloss_cache.get(raw_gloss)
+        if cached is None:
+            # A gloss that already failed validation fails the same way again
+            rejection = self._rejected_gloss_cache.get(raw_gloss)
+            if rejection is not None:
+                raise ValueError(rejection)
+
+            try:
+                cached = self._parse_raw_gloss_uncached(raw_gloss)
+            except ValueError as e:
+                self._rejected_gloss_cache[raw_gloss] = str(e)
+                raise
+            self._parsed_gloss_cache[raw_gloss] = cached
+        return cached
+
+    def parse_raw_glosses(self, raw_glosses: Iterable[str]) -> List[ParsedGloss]:
+        """
+        Parse several standardized gnc.ge format raw_glosses in one call
+
+        Args:
+            raw_glosses: Strings in gnc.ge format
+
+        Returns:
+            ParsedGloss objects in input order
+
+        Raises:
+            ValueError: If any raw_gloss is missing required components
+        """
+        parsed_cache = self._parsed_gloss_cache
+        parse_raw_gloss = self.parse_raw_gloss
+
+        results = []
+        for raw_gloss in raw_glosses:
+            cached = parsed_cache.get(raw_gloss)
+            if cached is None:
+                results.append(parse_raw_gloss(raw_gloss))
+            else:
+                results.append(_copy_parsed_gloss(cached))
+        return results
+
+    def _parse_raw_gloss_uncached(self, raw_gloss: str) -> ParsedGloss:
+        """Parse a raw gloss string without consulting the memo cache."""
         try:
             # Use shared validation
             if not self._validate_basic_format(raw_gloss):
@@ -128,41 +251,40 @@ class ArgumentProcessor(BaseGlossParser):
                 )
 
             raw_gloss = raw_gloss.strip()
-            parts = self._split_components(raw_gloss)
 
             # If only "V" is present, fail - this is incomplete
-            if len(parts) == 1 and parts[0] == "V":
+            if raw_gloss == "V":
                 raise ValueError(
                     f"Raw gloss '{raw_gloss}' is incomplete. "
                     "Must include: voice, tense, argument pattern, and case specifications. "
                     "Example: 'V Act Pres <S-DO> <S:Nom> <DO:Dat>'"
                 )
 
-            # Parse components
-            voice = None
-            tense = None
-            preverb = None
+            # Parse components; V/voice/tense/Pv tokens land in their slot directly
+            header = {}
             argument_pattern = None
             arguments = {}
 
             # Parse each component
-            for part in parts:
-                if part == "V":
-                    continue  # Skip verb marker
-                elif part in self.valid_voices:
-                    voice = part
-                elif part in self.valid_tenses:
-                    tense = part
-                elif part == "Pv":
-                    preverb = "Pv"
-                elif part.startswith("<") and part.endswith(">"):
-                    if ":" in part:
-                        # Case specification like <S:Nom> or <DO:Dat>
-                        self._parse_case_specification(part, arguments)
-                    else:
-                        # Argument pattern like <S-DO>
-                        argument_pattern = part
-                        self._parse_argument_pattern(part, arguments)
+            token_kinds = self._token_kinds
+            for match in _GLOSS_TOKEN_RE.finditer(raw_gloss):
+                # Glosses draw on a small vocabulary; interned tokens are shared
+                # by every cached ParsedGloss
+                part = sys.intern(match.group())
+                kind = token_kinds.get(part)
+                if kind is not None:
+                    header[kind] = part
+                elif match.lastgroup == "case_spec":
+                    # Case specification like <S:Nom> or <DO:Dat>
+                    self._parse_case_specification(part, arguments)
+                elif match.lastgroup == "argument_pattern":
+                    # Argument pattern like <S-DO>
+                    argument_pattern = part
+                    self._parse_argument_pattern(part, arguments)
+
+            voice = header.get("voice")
+            tense = header.get("tense")
+            preverb = header.get("preverb")
 
             # Validate all required components are present
             missing_components = []
@@ -203,57 +325,56 @@ class ArgumentProcessor(BaseGlossParser):
                 arguments=arguments,
             )
 
-        except Exception as e:
+        except ValueError as e:
+            # Only the validation errors above are expected here; anything else
+            # is a bug and should surface with its own type and traceback
             safe_log(logger, "error", f"Error parsing raw_gloss '{raw_gloss}': {e}")
             raise ValueError(f"Failed to parse raw_gloss: {e}")
 
     def _parse_case_specification(self, case_spec: str, result: Dict) -> None:
         """Parse case specification like <S:Nom> or <DO:Dat>"""
-        try:
-            # Remove < > brackets
-            content = case_spec[1:-1]
-            if ":" not in content:
-                return
+        # Locate the colon inside the < > brackets and slice both halves out
+        # directly, without an intermediate bracket-less copy or split list
+        colon = case_spec.find(":", 1, -1)
+        if colon == -1:
+            return
 
-            arg_type, case = content.split(":", 1)
+        arg_type = case_spec[1:colon]
+        case = case_spec[colon + 1 : -1]
 
-            # Map argument type to argument name
-            arg_name = self._map_argument_type_to_name(arg_type)
-            if arg_name:
-                result[arg_name] = {"type": arg_type, "case": case}
-
-        except Exception as e:
-            safe_log(
-                logger,
-                "warning",
-                f"Failed to parse case specification '{case_spec}': {e}",
-            )
+        # Map argument type to argument name
+        arg_name = self._map_argument_type_to_name(arg_type)
+        if arg_name:
+            result[arg_name] = {"type": sys.intern(arg_type), "case": sys.intern(case)}
 
     def _parse_argument_pattern(self, pattern: str, result: Dict) -> None:
         """Parse argument pattern like <S-DO> and set up argument structure"""
-        try:
-            # Remove < > brackets
-            content = pattern[1:-1]
-            if not content:
-                return
-
-            # Split by dash to get individual argument types
-            arg_types = content.split("-")
-
-            for arg_type in arg_types:
-                arg_name = self._map_argument_type_to_name(arg_type)
-                if arg_name and arg_name not in result:
-                    # Don't set default case - case must be explicitly specified
-                    # The case will be set when the case specification is parsed
-                    result[arg_name] = {
-                        "type": arg_type,
-                        "case": None,  # Will be set by case specification
-                    }
-
-        except Exception as e:
-            safe_log(
-                logger, "warning", f"Failed to parse argument pattern '{pattern}': {e}"
-            )
+        pattern_arguments = self._pattern_arguments.get(pattern)
+        if pattern_arguments is None:
+            pattern_arguments = self._resolve_pattern_arguments(pattern)
+
+        for arg_type, arg_name in pattern_arguments:
+            if arg_name not in result:
+                # Don't set default case - case must be explicitly specified
+                # The case will be set when the case specification is parsed
+                result[arg_name] = {
+                    "type": arg_type,
+                    "case": None,  # Will be set by case specification
+                }
+
+    def _resolve_pattern_arguments(self, pattern: str) -> Tuple[Tuple[str, str], ...]:
+        """Resolve <S-DO> style patterns into (arg_type, arg_name) pairs"""
+        # Remove < > brackets and split by dash to get individual argument types
+        content = pattern[1:-1]
+        if not content:
+            return ()
+
+        pairs = []
+        for arg_type in content.split("-"):
+            arg_name = self._map_argument_type_to_name(arg_type)
+            if arg_name:
+                pairs.append((arg_type, arg_name))
+        return tuple(pairs)
 
     def _map_argument_type_to_name(self, arg_type: str) -> Optional[str]:
         """Map argument type abbreviation to full name"""
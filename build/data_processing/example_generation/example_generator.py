@@ -9,6 +9,10 @@ This generator emits tokenized, layered examples:
 """
 
 import logging
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Any
 
 from build.data_processing.example_generation.argument_processor import ArgumentProcessor
@@ -23,25 +27,93 @@ from build.utils.unicode_console import safe_log
 
 logger = logging.getLogger(__name__)
 
+# Word-boundary patterns used by subject-verb agreement
+_AM_PATTERN = re.compile(r"\bam\b")
+_WAS_PATTERN = re.compile(r"\bwas\b")
+_CONSONANTS = frozenset("bcdfghjklmnpqrstvwxz")
+
+
+@lru_cache(maxsize=1024)
+def _has_should(verb_translation: str) -> bool:
+    """Check whether an optative translation already carries 'should'."""
+    return "should" in verb_translation.lower().split()
+
 
 class ExampleGenerationError(Exception):
     """Raised when example generation fails."""
 
 
 class ExampleGenerator:
-    def __init__(self):
-        self.argument_processor = ArgumentProcessor()
-        self.case_names = CASE_NAMES
-        self.role_descriptions = ROLE_DESCRIPTIONS
-        self.tense_mapping = TENSE_MAPPING
-        self.reverse_tense_mapping = REVERSE_TENSE_MAPPING
-        self.IMPERATIVE_PERSONS = ["2sg", "2pl"]
-        self.STANDARD_PERSONS = ["1sg", "3sg", "3pl"]
-        self.DATABASE_TYPE_MAPPING = {
+    # Words skipped when looking for the noun that takes the definite article
+    _ARTICLE_STOP_WORDS = frozenset(
+        {
+            "the",
+            "a",
+            "an",
+            "and",
+            "or",
+            "but",
+            "in",
+            "on",
+            "at",
+            "to",
+            "for",
+            "of",
+            "with",
+            "by",
+        }
+    )
+    _ARTICLE_PUNCTUATION = str.maketrans("", "", ".,!?;:")
+    _ARGUMENT_ROLES = ("subject", "direct_object", "indirect_object")
+    _THIRD_PERSONS = frozenset({"3sg", "3pl"})
+    _PRONOUN_PERSONS = frozenset({"1sg", "2sg", "1pl", "2pl"})
+    # English pronoun subjects for persons without a generated subject noun
+    _PERSON_TEXT = MappingProxyType(
+        {
+            "1sg": "I",
+            "2sg": "You,",
+            "1pl": "We",
+            "2pl": "You all (you formal),",
+        }
+    )
+    # Case used when the gloss leaves an argument's case unspecified
+    _DEFAULT_ROLE_CASES = MappingProxyType(
+        {
+            "subject": "Nom",
+            "direct_object": "Nom",
+            "indirect_object": "Dat",
+        }
+    )
+
+    # Shared read-only tables; kept as attributes for existing callers
+    case_names = CASE_NAMES
+    role_descriptions = ROLE_DESCRIPTIONS
+    tense_mapping = TENSE_MAPPING
+    reverse_tense_mapping = REVERSE_TENSE_MAPPING
+    IMPERATIVE_PERSONS = ("2sg", "2pl")
+    STANDARD_PERSONS = ("1sg", "3sg", "3pl")
+    DATABASE_TYPE_MAPPING = MappingProxyType(
+        {
             "subject": "subjects",
             "direct_object": "direct_objects",
             "indirect_object": "indirect_objects",
         }
+    )
+
+    def __init__(self):
+        self.argument_processor = ArgumentProcessor()
+
+    def _get_argument_prepositions(self, verb_data: Optional[Dict]) -> Tuple[str, str, str]:
+        """Return (subject, direct_object, indirect_object) prepositions for a verb."""
+        if not verb_data:
+            return "", "", ""
+
+        prepositions = verb_data.get("syntax", {}).get("prepositions", {})
+        return (
+            prepositions.get("subject", ""),
+            prepositions.get("direct_object", ""),
+            prepositions.get("indirect_object", ""),
+        )
 
     def _get_default_composition_orders(self, syntax: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         """
@@ -76,7 +148,7 @@ class ExampleGenerator:
         )
 
     def _should_include_subject(self, person: str) -> bool:
-        return person in ["3sg", "3pl"]
+        return person in self._THIRD_PERSONS
 
     def _append_role_tokens(
         self, role_tokens: Dict[str, List[Dict[str, Any]]], role: str, tokens: List[Dict[str, Any]]
@@ -92,17 +164,19 @@ class ExampleGenerator:
         verb_data: Optional[Dict] = None,
         effective_preverb: str = "",
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        mapped_tense = self.tense_mapping.get(tense, tense)
+        verb_translation = self._get_verb_translation(verb_data, mapped_tense, effective_preverb)
         if tense == "Opt" and georgian_verb_form != "-":
             georgian_text = f"უნდა {georgian_verb_form}"
-            english_text = f"should {self._get_verb_translation(verb_data, self.tense_mapping.get(tense, tense), effective_preverb)}"
+            if _has_should(verb_translation):
+                english_text = verb_translation
+            else:
+                english_text = f"should {verb_translation}"
         else:
             georgian_text = georgian_verb_form
-            english_text = self._get_verb_translation(
-                verb_data, self.tense_mapping.get(tense, tense), effective_preverb
-            )
+            english_text = verb_translation
 
         if verb_data:
-            mapped_tense = self.tense_mapping.get(tense, tense)
             english_text = self._apply_subject_verb_agreement(
                 english_text, mapped_tense, person
             )
@@ -147,13 +221,18 @@ class ExampleGenerator:
         if not noun_key:
             raise ValueError(f"Missing noun for role={role}, person={person}")
 
+        # Bind the processor and its lazily-loaded databases once per call
+        processor = self.argument_processor
+        databases = processor.databases
+        get_english_translation = processor.get_english_translation
+
         number = "plural" if (person == "3pl" and role == "subject") else "singular"
-        noun_ge = self.argument_processor.get_case_form(
-            noun_key, role_case.lower(), self.argument_processor.databases, number
-        )
-        noun_en = self.argument_processor.get_english_translation(
-            noun_key, self.argument_processor.databases, "noun", number
+        # Case names and case forms repeat across every example of the corpus
+        case = sys.intern(role_case.lower())
+        noun_ge = sys.intern(
+            processor.get_case_form(noun_key, case, databases, number)
         )
+        noun_en = get_english_translation(noun_key, databases, "noun", number)
 
         ge_tokens: List[Dict[str, Any]] = []
         en_tokens: List[Dict[str, Any]] = []
@@ -164,11 +243,11 @@ class ExampleGenerator:
             )
 
         if adjective_key:
-            adj_ge = self.argument_processor.get_adjective_form(
-                adjective_key, role_case.lower(), self.argument_processor.databases
+            adj_ge = sys.intern(
+                processor.get_adjective_form(adjective_key, case, databases)
             )
-            adj_en = self.argument_processor.get_english_translation(
-                adjective_key, self.argument_processor.databases, "adjective", "singular"
+            adj_en = get_english_translation(
+                adjective_key, databases, "adjective", "singular"
             )
             ge_tokens.append(
                 {"text": adj_ge, "role": role, "part": "adjective", "layer": "adjectives", "toggleable": True}
@@ -184,7 +263,7 @@ class ExampleGenerator:
             {"text": noun_en, "role": role, "part": "noun", "layer": "always", "toggleable": False}
         )
 
-        ge_component = {"text": self._tokens_to_text(ge_tokens), "case": role_case.lower(), "role": role}
+        ge_component = {"text": self._tokens_to_text(ge_tokens), "case": case, "role": role}
         en_component = self._make_component_summary(en_tokens, role, person if role == "subject" else "")
 
         return ge_tokens, en_tokens, ge_component, en_component
@@ -250,6 +329,23 @@ class ExampleGenerator:
             [{"text": en, "role": "locative_surface", "layer": "always", "toggleable": False}],
         )
 
+    def _parse_gloss_arguments(self, raw_gloss: str) -> Dict[str, Dict]:
+        """Parse a raw gloss into its argument structure, failing on invalid input."""
+        if not raw_gloss or not raw_gloss.strip():
+            raise ValueError(
+                "Raw gloss is required for example generation - no defaults allowed"
+            )
+
+        try:
+            # Examples only read the argument structure, so the shared parse will do
+            parsed_gloss = self.argument_processor.get_parsed_gloss(raw_gloss)
+            return parsed_gloss.arguments
+        except Exception as e:
+            # Parsing failed - generation should fail, not use defaults
+            raise ValueError(
+                f"Failed to parse raw gloss '{raw_gloss}': {e}. Raw gloss must be valid."
+            )
+
     def generate_example_structured(
         self,
         verb_id: int,
@@ -262,143 +358,193 @@ class ExampleGenerator:
         effective_preverb: str = "",
     ) -> Dict[str, Any]:
         try:
-            if not raw_gloss or not raw_gloss.strip():
-                raise ValueError(
-                    "Raw gloss is required for example generation - no defaults allowed"
-                )
-
-            try:
-                parsed_gloss = self.argument_processor.parse_raw_gloss(raw_gloss)
-                arguments = parsed_gloss.arguments
-            except Exception as e:
-                # Parsing failed - generation should fail, not use defaults
-                raise ValueError(
-                    f"Failed to parse raw gloss '{raw_gloss}': {e}. Raw gloss must be valid."
-                )
+            arguments = self._parse_gloss_arguments(raw_gloss)
+            return self._build_structured_example(
+                arguments, tense, person, georgian_verb_form, verb_data, effective_preverb
+            )
+        except Exception as e:
+            safe_log(
+                logger,
+                "error",
+                f"Failed to generate structured example for verb {verb_id}, tense {tense}, person {person}: {e}",
+            )
+            logger.exception("Structured example generation traceback")
+            raise ExampleGenerationError(f"Structured example generation failed: {e}")
 
-            ge_role_tokens: Dict[str, List[Dict[str, Any]]] = {}
-            en_role_tokens: Dict[str, List[Dict[str, Any]]] = {}
-            georgian_components: Dict[str, Dict[str, Any]] = {}
-            english_components: Dict[str, Dict[str, Any]] = {}
+    def generate_paradigm(
+        self,
+        verb_id: int,
+        tense: str,
+        raw_gloss: str,
+        verb_semantics: str,
+        person_forms: List[Tuple[str, str, str]],
+        verb_data: Optional[Dict] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate structured examples for several persons of one verb and tense.
 
-            syntax = verb_data.get("syntax", {}) if verb_data else {}
-            syntax_args = syntax.get("arguments", {})
-            syntax_prepositions = syntax.get("prepositions", {})
-
-            if "subject" in arguments and self._should_include_subject(person):
-                subject_cfg = syntax_args.get("subject", {}).get(person, {})
-                ge_t, en_t, ge_c, en_c = self._build_argument_tokens(
-                    person,
-                    "subject",
-                    subject_cfg,
-                    arguments["subject"].get("case", "Nom"),
-                    syntax_prepositions.get("subject", ""),
-                )
-                georgian_components["subject"] = ge_c
-                english_components["subject"] = en_c
-                self._append_role_tokens(ge_role_tokens, "subject", ge_t)
-                self._append_role_tokens(en_role_tokens, "subject", en_t)
-            elif person in ["1sg", "2sg", "1pl", "2pl"]:
-                en_role_tokens["subject"] = [
-                    {
-                        "text": self._get_person_text(person),
-                        "role": "subject",
-                        "layer": "always",
-                        "toggleable": False,
-                    }
-                ]
-                english_components["subject"] = {
-                    "text": self._get_person_text(person),
-                    "role": "subject",
-                    "person": person,
-                }
+        The raw gloss is parsed once and shared by every person instead of
+        once per generate_example_structured call.
 
-            if "direct_object" in arguments:
-                do_cfg = syntax_args.get("direct_object", {}).get(person, {})
-                ge_t, en_t, ge_c, en_c = self._build_argument_tokens(
-                    person,
-                    "direct_object",
-                    do_cfg,
-                    arguments["direct_object"].get("case", "Nom"),
-                    syntax_prepositions.get("direct_object", ""),
-                )
-                georgian_components["direct_object"] = ge_c
-                english_components["direct_object"] = en_c
-                self._append_role_tokens(ge_role_tokens, "direct_object", ge_t)
-                self._append_role_tokens(en_role_tokens, "direct_object", en_t)
-
-            if "indirect_object" in arguments:
-                io_cfg = syntax_args.get("indirect_object", {}).get(person, {})
-                ge_t, en_t, ge_c, en_c = self._build_argument_tokens(
-                    person,
-                    "indirect_object",
-                    io_cfg,
-                    arguments["indirect_object"].get("case", "Dat"),
-                    syntax_prepositions.get("indirect_object", ""),
-                )
-                georgian_components["indirect_object"] = ge_c
-                english_components["indirect_object"] = en_c
-                self._append_role_tokens(ge_role_tokens, "indirect_object", ge_t)
-                self._append_role_tokens(en_role_tokens, "indirect_object", en_t)
-
-            ge_vn, en_vn, ge_adv, en_adv = self._build_verbal_noun_tokens(verb_data or {}, person)
-            self._append_role_tokens(ge_role_tokens, "verbal_noun", ge_vn)
-            self._append_role_tokens(en_role_tokens, "verbal_noun", en_vn)
-            self._append_role_tokens(ge_role_tokens, "adverb", ge_adv)
-            self._append_role_tokens(en_role_tokens, "adverb", en_adv)
-            if ge_vn:
-                georgian_components["verbal_noun"] = self._make_component_summary(ge_vn, "verbal_noun")
-                english_components["verbal_noun"] = self._make_component_summary(en_vn, "verbal_noun")
-            if ge_adv:
-                georgian_components["adverb"] = self._make_component_summary(ge_adv, "adverb")
-                english_components["adverb"] = self._make_component_summary(en_adv, "adverb")
-
-            ge_loc, en_loc = self._build_locative_surface_tokens(verb_data or {}, person)
-            self._append_role_tokens(ge_role_tokens, "locative_surface", ge_loc)
-            self._append_role_tokens(en_role_tokens, "locative_surface", en_loc)
-            if ge_loc:
-                georgian_components["locative_surface"] = self._make_component_summary(
-                    ge_loc, "locative_surface"
-                )
-                english_components["locative_surface"] = self._make_component_summary(
-                    en_loc, "locative_surface"
-                )
+        Args:
+            verb_id: Verb identifier (used for error reporting)
+            tense: Mapped tense name (Pres, Impf, etc.)
+            raw_gloss: Raw gloss for the tense
+            verb_semantics: Semantic key of the verb
+            person_forms: (person, georgian_verb_form, effective_preverb) tuples
+            verb_data: Verb data dictionary
 
-            ge_v_tok, en_v_tok = self._build_verb_component(
-                tense, person, georgian_verb_form, verb_data, effective_preverb
-            )
-            ge_role_tokens["verb"] = [ge_v_tok]
-            en_role_tokens["verb"] = [en_v_tok]
-            georgian_components["verb"] = {"text": ge_v_tok["text"], "role": "verb"}
-            english_components["verb"] = {"text": en_v_tok["text"], "role": "verb"}
-
-            ge_order, en_order = self._get_default_composition_orders(syntax)
-
-            ge_tokens = self._compose_by_order(ge_order, ge_role_tokens)
-            en_tokens = self._compose_by_order(en_order, en_role_tokens)
-            georgian_sentence = self._tokens_to_text(ge_tokens)
-            english_sentence = self._capitalize_sentence(self._tokens_to_text(en_tokens))
-
-            return {
-                "georgian": georgian_sentence,
-                "georgian_components": georgian_components,
-                "english": english_sentence,
-                "english_components": english_components,
-                "tokens": {"georgian": ge_tokens, "english": en_tokens},
-                "georgian_verb_form": georgian_verb_form,
-                "person": person,
-                "effective_preverb": effective_preverb,
-            }
+        Returns:
+            List of structured examples in person_forms order
+        """
+        if not person_forms:
+            return []
 
+        try:
+            arguments = self._parse_gloss_arguments(raw_gloss)
         except Exception as e:
             safe_log(
                 logger,
                 "error",
-                f"Failed to generate structured example for verb {verb_id}, tense {tense}, person {person}: {e}",
+                f"Failed to generate structured examples for verb {verb_id}, tense {tense}: {e}",
             )
             logger.exception("Structured example generation traceback")
             raise ExampleGenerationError(f"Structured example generation failed: {e}")
 
+        # Every person shares the verb, so look its prepositions up once
+        role_prepositions = self._get_argument_prepositions(verb_data)
+
+        examples = []
+        for person, georgian_verb_form, effective_preverb in person_forms:
+            try:
+                examples.append(
+                    self._build_structured_example(
+                        arguments,
+                        tense,
+                        person,
+                        georgian_verb_form,
+                        verb_data,
+                        effective_preverb,
+                        role_prepositions,
+                    )
+                )
+            except Exception as e:
+                safe_log(
+                    logger,
+                    "error",
+                    f"Failed to generate structured example for verb {verb_id}, tense {tense}, person {person}: {e}",
+                )
+                logger.exception("Structured example generation traceback")
+                raise ExampleGenerationError(f"Structured example generation failed: {e}")
+        return examples
+
+    def _build_structured_example(
+        self,
+        arguments: Dict[str, Dict],
+        tense: str,
+        person: str,
+        georgian_verb_form: str,
+        verb_data: Optional[Dict] = None,
+        effective_preverb: str = "",
+        role_prepositions: Optional[Tuple[str, str, str]] = None,
+    ) -> Dict[str, Any]:
+        ge_role_tokens: Dict[str, List[Dict[str, Any]]] = {}
+        en_role_tokens: Dict[str, List[Dict[str, Any]]] = {}
+        georgian_components: Dict[str, Dict[str, Any]] = {}
+        english_components: Dict[str, Dict[str, Any]] = {}
+
+        syntax = verb_data.get("syntax", {}) if verb_data else {}
+        syntax_args = syntax.get("arguments", {})
+        if role_prepositions is None:
+            role_prepositions = self._get_argument_prepositions(verb_data)
+
+        active = {role for role in self._ARGUMENT_ROLES if role in arguments}
+        include_subject = "subject" in active and person in self._THIRD_PERSONS
+
+        for role, preposition in zip(self._ARGUMENT_ROLES, role_prepositions):
+            if role == "subject" and not include_subject:
+                # 1st/2nd person subjects are rendered as English pronouns only
+                if person in self._PRONOUN_PERSONS:
+                    person_text = self._get_person_text(person)
+                    en_role_tokens["subject"] = [
+                        {
+                            "text": person_text,
+                            "role": "subject",
+                            "layer": "always",
+                            "toggleable": False,
+                        }
+                    ]
+                    english_components["subject"] = {
+                        "text": person_text,
+                        "role": "subject",
+                        "person": person,
+                    }
+                continue
+            if role not in active:
+                continue
+
+            role_cfg = syntax_args.get(role, {}).get(person, {})
+            ge_t, en_t, ge_c, en_c = self._build_argument_tokens(
+                person,
+                role,
+                role_cfg,
+                arguments[role].get("case", self._DEFAULT_ROLE_CASES[role]),
+                preposition,
+            )
+            georgian_components[role] = ge_c
+            english_components[role] = en_c
+            self._append_role_tokens(ge_role_tokens, role, ge_t)
+            self._append_role_tokens(en_role_tokens, role, en_t)
+
+        ge_vn, en_vn, ge_adv, en_adv = self._build_verbal_noun_tokens(verb_data or {}, person)
+        self._append_role_tokens(ge_role_tokens, "verbal_noun", ge_vn)
+        self._append_role_tokens(en_role_tokens, "verbal_noun", en_vn)
+        self._append_role_tokens(ge_role_tokens, "adverb", ge_adv)
+        self._append_role_tokens(en_role_tokens, "adverb", en_adv)
+        if ge_vn:
+            georgian_components["verbal_noun"] = self._make_component_summary(ge_vn, "verbal_noun")
+            english_components["verbal_noun"] = self._make_component_summary(en_vn, "verbal_noun")
+        if ge_adv:
+            georgian_components["adverb"] = self._make_component_summary(ge_adv, "adverb")
+            english_components["adverb"] = self._make_component_summary(en_adv, "adverb")
+
+        ge_loc, en_loc = self._build_locative_surface_tokens(verb_data or {}, person)
+        self._append_role_tokens(ge_role_tokens, "locative_surface", ge_loc)
+        self._append_role_tokens(en_role_tokens, "locative_surface", en_loc)
+        if ge_loc:
+            georgian_components["locative_surface"] = self._make_component_summary(
+                ge_loc, "locative_surface"
+            )
+            english_components["locative_surface"] = self._make_component_summary(
+                en_loc, "locative_surface"
+            )
+
+        ge_v_tok, en_v_tok = self._build_verb_component(
+            tense, person, georgian_verb_form, verb_data, effective_preverb
+        )
+        ge_role_tokens["verb"] = [ge_v_tok]
+        en_role_tokens["verb"] = [en_v_tok]
+        georgian_components["verb"] = {"text": ge_v_tok["text"], "role": "verb"}
+        english_components["verb"] = {"text": en_v_tok["text"], "role": "verb"}
+
+        ge_order, en_order = self._get_default_composition_orders(syntax)
+
+        ge_tokens = self._compose_by_order(ge_order, ge_role_tokens)
+        en_tokens = self._compose_by_order(en_order, en_role_tokens)
+        georgian_sentence = self._tokens_to_text(ge_tokens)
+        english_sentence = self._capitalize_sentence(self._tokens_to_text(en_tokens))
+
+        return {
+            "georgian": georgian_sentence,
+            "georgian_components": georgian_components,
+            "english": english_sentence,
+            "english_components": english_components,
+            "tokens": {"georgian": ge_tokens, "english": en_tokens},
+            "georgian_verb_form": georgian_verb_form,
+            "person": person,
+            "effective_preverb": effective_preverb,
+        }
+
     def _get_english_base_form(self, key: str, number: str, database_type: str) -> str:
         try:
             return self.argument_processor.get_english_translation(
@@ -410,26 +556,17 @@ class ExampleGenerator:
     def _add_definite_article(self, text: str) -> str:
         """Add definite article 'The' to the first noun in text"""
         words = text.split()
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-        }
+
+        # Single-word phrases are the common case; skip the scan loop
+        if len(words) == 1:
+            clean_word = words[0].translate(self._ARTICLE_PUNCTUATION).lower()
+            if clean_word not in self._ARTICLE_STOP_WORDS and len(clean_word) > 2:
+                return f"The {words[0]}"
+            return words[0]
 
         for i, word in enumerate(words):
-            clean_word = word.lower().strip(".,!?;:")
-            if clean_word not in stop_words and len(clean_word) > 2:
+            clean_word = word.translate(self._ARTICLE_PUNCTUATION).lower()
+            if clean_word not in self._ARTICLE_STOP_WORDS and len(clean_word) > 2:
                 words[i] = f"The {word}"
                 break
 
@@ -449,13 +586,11 @@ class ExampleGenerator:
         Returns:
             Verb translation with proper subject-verb agreement
         """
-        import re
-
         # Present tense 3rd person singular: handle special cases
         if tense == "Pres" and person == "3sg":
             # Handle "am" → "is"
             if "am" in verb_translation:
-                return re.sub(r"\bam\b", "is", verb_translation)
+                return _AM_PATTERN.sub("is", verb_translation)
 
             # Handle special verb endings for 3rd person singular
             # Verbs ending in -o, -s, -x, -z, -ch, -sh get "es" ending
@@ -465,8 +600,7 @@ class ExampleGenerator:
             # Verbs ending in consonant + y change y to ies
             if verb_translation.endswith("y") and len(verb_translation) > 1:
                 # Check if the character before 'y' is a consonant
-                consonants = "bcdfghjklmnpqrstvwxz"
-                if verb_translation[-2].lower() in consonants:
+                if verb_translation[-2].lower() in _CONSONANTS:
                     return verb_translation[:-1] + "ies"
 
             # Check if the verb already ends with "s" (like "was", "is", etc.)
@@ -477,19 +611,19 @@ class ExampleGenerator:
         if tense == "Pres" and person == "3pl":
             if "am" in verb_translation:
                 # Use word boundary replacement to avoid affecting words like "familiar"
-                return re.sub(r"\bam\b", "are", verb_translation)
+                return _AM_PATTERN.sub("are", verb_translation)
 
         # Imperfect tense 3rd person plural: change "was" to "were"
         if tense == "Impf" and person == "3pl":
             if "was" in verb_translation:
                 # Use word boundary replacement to avoid affecting other words
-                return re.sub(r"\bwas\b", "were", verb_translation)
+                return _WAS_PATTERN.sub("were", verb_translation)
 
         # Aorist tense 3rd person plural: change "was" to "were"
         if tense == "Aor" and person == "3pl":
             if "was" in verb_translation:
                 # Use word boundary replacement to avoid affecting other words
-                return re.sub(r"\bwas\b", "were", verb_translation)
+                return _WAS_PATTERN.sub("were", verb_translation)
 
         return verb_translation
 
@@ -615,7 +749,7 @@ class ExampleGenerator:
                 georgian_text = f"{adj_case_form} {case_form}"
 
             # Add definite article if case is Nom or Acc
-            if case in ["nom", "acc"]:
+            if case in {"nom", "acc"}:
                 georgian_text = self._add_definite_article(georgian_text)
 
             # Get English form - pass number parameter for 3pl subjects
@@ -657,13 +791,7 @@ class ExampleGenerator:
 
     def _get_person_text(self, person: str) -> str:
         """Get the English text for a person"""
-        person_mapping = {
-            "1sg": "I",
-            "2sg": "You,",
-            "1pl": "We",
-            "2pl": "You all (you formal),",
-        }
-        return person_mapping.get(person, "subject")
+        return self._PERSON_TEXT.get(person, "subject")
 
     def _get_database_type(self, argument_type: str) -> str:
         """
@@ -678,6 +806,12 @@ class ExampleGenerator:
         return self.DATABASE_TYPE_MAPPING.get(argument_type, "subjects")
 
 
+@lru_cache(maxsize=None)
+def _get_generator() -> ExampleGenerator:
+    """Return the shared generator so its parse and preposition caches persist across verbs."""
+    return ExampleGenerator()
+
+
 def generate_examples(
     verb_data: Dict, tense: str, selected_preverbs: Optional[List[str]] = None
 ) -> Dict[str, Any]:
@@ -753,8 +887,10 @@ def generate_examples(
         # Generate examples for each preverb
         all_examples = []
         fallback_warnings = []
+        paradigm_preverbs: List[str] = []
+        paradigm_forms: List[Tuple[str, str, str]] = []
 
-        generator = ExampleGenerator()
+        generator = _get_generator()
 
         # For imperative tense, use 2sg and 2pl instead of 1sg, 3sg, 3pl
         if tense == "imperative":
@@ -762,21 +898,25 @@ def generate_examples(
         else:
             persons = generator.STANDARD_PERSONS
 
-        # Generate examples for each person across all preverbs
-        for person in persons:
-            for preverb in preverbs_to_generate:
-                safe_log(
-                    logger,
-                    "info",
-                    f"[EXAMPLES] Generating example for person: {person}, preverb: {preverb}",
-                )
+        # Handle preverb fallbacks (even for empty preverbs); they depend only on
+        # the preverb and tense, so resolve them once rather than per person
+        effective_preverbs = []
+        for preverb in preverbs_to_generate:
+            effective_preverb = get_effective_preverb(verb_data, preverb, tense)
+            safe_log(
+                logger,
+                "info",
+                f"[EXAMPLES] Effective preverb for {preverb}: {effective_preverb}",
+            )
+            effective_preverbs.append((preverb, effective_preverb))
 
-                # Handle preverb fallbacks (even for empty preverbs)
-                effective_preverb = get_effective_preverb(verb_data, preverb, tense)
+        # Collect the valid form for each person across all preverbs
+        for person in persons:
+            for preverb, effective_preverb in effective_preverbs:
                 safe_log(
                     logger,
                     "info",
-                    f"[EXAMPLES] Effective preverb for {preverb}: {effective_preverb}",
+                    f"[EXAMPLES] Resolving form for person: {person}, preverb: {preverb}",
                 )
 
                 # Check if preverb fallback occurred
@@ -813,51 +953,56 @@ def generate_examples(
                     )
                     continue
 
-                # Generate the example
-                mapped_tense = generator.tense_mapping.get(tense, tense)
-                safe_log(
-                    logger,
-                    "info",
-                    f"[EXAMPLES] Original tense: '{tense}', mapped tense: '{mapped_tense}'",
-                )
-                # Use the structured method
-                example = generator.generate_example_structured(
-                    verb_id=verb_id,
-                    tense=mapped_tense,
-                    person=person,
-                    raw_gloss=raw_gloss,
-                    verb_semantics=verb_semantics,
-                    georgian_verb_form=georgian_form,
-                    verb_data=verb_data,
-                    effective_preverb=effective_preverb,
-                )
+                paradigm_preverbs.append(preverb)
+                paradigm_forms.append((person, georgian_form, effective_preverb))
+
+        # Generate all collected forms in one paradigm call so the raw gloss
+        # is parsed once per tense rather than once per person
+        mapped_tense = generator.tense_mapping.get(tense, tense)
+        safe_log(
+            logger,
+            "info",
+            f"[EXAMPLES] Original tense: '{tense}', mapped tense: '{mapped_tense}'",
+        )
+        examples = generator.generate_paradigm(
+            verb_id=verb_id,
+            tense=mapped_tense,
+            raw_gloss=raw_gloss,
+            verb_semantics=verb_semantics,
+            person_forms=paradigm_forms,
+            verb_data=verb_data,
+        )
+
+        for preverb, (_, _, effective_preverb), example in zip(
+            paradigm_preverbs, paradigm_forms, examples
+        ):
+            safe_log(
+                logger,
+                "info",
+                f"[EXAMPLES] Generated structured example: {example.get('georgian', 'N/A')} -> {example.get('english_components', 'N/A')}",
+            )
+
+            # Find or create the preverb group in all_examples
+            preverb_group = None
+            for group in all_examples:
+                if group["preverb"] == preverb:
+                    preverb_group = group
+                    break
+
+            if not preverb_group:
+                preverb_group = {
+                    "preverb": preverb,
+                    "effective_preverb": effective_preverb,
+                    "examples": [],
+                }
+                all_examples.append(preverb_group)
                 safe_log(
                     logger,
                     "info",
-                    f"[EXAMPLES] Generated structured example: {example.get('georgian', 'N/A')} -> {example.get('english_components', 'N/A')}",
+                    f"[EXAMPLES] Created preverb group for: {preverb}",
                 )
 
-                # Find or create the preverb group in all_examples
-                preverb_group = None
-                for group in all_examples:
-                    if group["preverb"] == preverb:
-                        preverb_group = group
-                        break
-
-                if not preverb_group:
-                    preverb_group = {
-                        "preverb": preverb,
-                        "effective_preverb": effective_preverb,
-                        "examples": [],
-                    }
-                    all_examples.append(preverb_group)
-                    safe_log(
-                        logger,
-                        "info",
-                        f"[EXAMPLES] Created preverb group for: {preverb}",
-                    )
-
-                preverb_group["examples"].append(example)
+            preverb_group["examples"].append(example)
 
         return {
             "examples": all_examples,
@@ -9,10 +9,12 @@ Used by: verb_data_processor.py for build pipeline output
 """
 
 import logging
-import json
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 from build.utils.shared_gloss_utils import BaseGlossParser, GlossComponent, GlossData
+from build.utils.common_utils import load_json_file
 from build.utils.config_manager import ConfigManager
 from build.utils.unicode_console import setup_unicode_console, safe_log
 
@@ -21,6 +23,52 @@ setup_unicode_console()
 
 logger = logging.getLogger(__name__)
 
+# Argument role abbreviation -> (color class, description)
+_ARGUMENT_TYPE_STYLES = MappingProxyType(
+    {
+        "S": ("gloss-subject", "Subject"),
+        "DO": ("gloss-direct-object", "Direct Object"),
+        "IO": ("gloss-indirect-object", "Indirect Object"),
+        # Add more argument types as needed
+        "A": ("gloss-agent", "Agent"),
+        "P": ("gloss-patient", "Patient"),
+        "T": ("gloss-theme", "Theme"),
+        "R": ("gloss-recipient", "Recipient"),
+    }
+)
+
+# Fallback descriptions for basic components missing from the gloss reference
+_COMPONENT_DESCRIPTIONS = MappingProxyType(
+    {
+        "V": "Verb",
+        "Act": "Active",
+        "Med": "Medial",
+        "Pass": "Passive",
+        "MedAct": "Medial Active",
+        "MedPass": "Medial Passive",
+        "Pres": "Present",
+        "Impf": "Imperfect",
+        "Fut": "Future",
+        "Aor": "Aorist",
+        "Opt": "Optative",
+        "Impv": "Imperative",
+        "Inv": "Inverted",
+        "AuxIntr": "Auxiliary Intransitive",
+        "AuxTrans": "Auxiliary Transitive",
+        "AuxTransHum": "Auxiliary Transitive Human",
+    }
+)
+
+# Fallback descriptions for argument patterns missing from the gloss reference
+_PATTERN_DESCRIPTIONS = MappingProxyType(
+    {
+        "<S>": "Intransitive absolute",
+        "<S-DO>": "Transitive absolute",
+        "<S-IO>": "Ditransitive (Subject-Indirect Object)",
+        "<S-DO-IO>": "Ditransitive (Subject-Direct Object-Indirect Object)",
+    }
+)
+
 
 class RobustGlossProcessor(BaseGlossParser):
     """Processes raw gloss strings into structured data for consistent HTML generation."""
@@ -32,8 +80,13 @@ class RobustGlossProcessor(BaseGlossParser):
         # Initialize config manager
         self.config = ConfigManager()
 
-        # Load gloss reference for proper expanded definitions
-        self.gloss_reference = self._load_gloss_reference()
+        # Load gloss reference for proper expanded definitions (read-only, the
+        # processor instance is shared through _get_gloss_processor)
+        self.gloss_reference = MappingProxyType(self._load_gloss_reference())
+
+        # Parsed glosses keyed by (raw_gloss, preverb); the corpus reuses a
+        # small vocabulary of gloss strings across verbs and tenses
+        self._parse_cache: Dict[tuple, GlossData] = {}
 
     def _load_gloss_reference(self) -> Dict[str, str]:
         """Load the gloss reference data for proper expanded definitions."""
@@ -41,8 +94,7 @@ class RobustGlossProcessor(BaseGlossParser):
             # Use config manager to get the gloss reference path
             gloss_ref_path = self.config.get_path("gloss_reference")
 
-            with open(gloss_ref_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json_file(gloss_ref_path)
         except Exception as e:
             logger.warning(f"Failed to load gloss reference: {e}")
             return {}
@@ -51,6 +103,9 @@ class RobustGlossProcessor(BaseGlossParser):
         """
         Parse a raw gloss string into structured GlossData.
 
+        Results are memoized per (raw_gloss, preverb), so the returned
+        GlossData is shared and must be treated as read-only.
+
         Args:
             raw_gloss: Raw gloss string (e.g., "V Act Pres <S-DO> <S:Nom>")
             preverb: Optional preverb value
@@ -58,6 +113,17 @@ class RobustGlossProcessor(BaseGlossParser):
         Returns:
             GlossData object with structured components
         """
+        cache_key = (raw_gloss, preverb)
+        gloss_data = self._parse_cache.get(cache_key)
+        if gloss_data is None:
+            gloss_data = self._parse_raw_gloss_uncached(raw_gloss, preverb)
+            self._parse_cache[cache_key] = gloss_data
+        return gloss_data
+
+    def _parse_raw_gloss_uncached(
+        self, raw_gloss: str, preverb: str = None
+    ) -> GlossData:
+        """Parse a raw gloss string without consulting the memo cache."""
 
         if not raw_gloss:
             return GlossData(raw_components=[], expanded_components=[])
@@ -85,8 +151,9 @@ class RobustGlossProcessor(BaseGlossParser):
                 component, component_type, preverb
             )
 
-            # Handle special cases for components that need splitting
-            if self._is_argument_pattern(component):
+            # Handle special cases for components that need splitting; the
+            # classification above already decided the bracketed forms
+            if component_type == "argument_pattern":
                 # Split compound argument pattern into multiple components for raw section
                 split_components = self._split_argument_pattern(component)
 
@@ -110,50 +177,45 @@ class RobustGlossProcessor(BaseGlossParser):
 
                 # Track the argument pattern
                 argument_pattern = component
+            elif component_type == "case_spec":
+                # Case specification like <S:Nom> - use semantic colors in both raw and expanded
+                case_specs.append(component)
+                semantic_color = self._get_case_color(component)
+
+                raw_components.append(
+                    GlossComponent(
+                        text=component,
+                        component_type=component_type,
+                        color_class=semantic_color,
+                        description=description,
+                    )
+                )
+                expanded_components.append(
+                    GlossComponent(
+                        text=component,
+                        component_type="case_spec",
+                        color_class=semantic_color,
+                        description=description,
+                    )
+                )
             else:
-                # Create raw component
-                raw_comp = GlossComponent(
-                    text=component,
-                    component_type=component_type,
-                    color_class=color_class,
-                    description=description,
+                # Regular components and auxiliary/modifier markers
+                raw_components.append(
+                    GlossComponent(
+                        text=component,
+                        component_type=component_type,
+                        color_class=color_class,
+                        description=description,
+                    )
                 )
-                raw_components.append(raw_comp)
-
-                # Handle special cases for expanded components
-                if component.startswith("<") and component.endswith(">"):
-                    if self._is_case_specification(component):
-                        # Case specification like <S:Nom> - use semantic colors in both raw and expanded
-                        case_specs.append(component)
-                        semantic_color = self._get_case_color(component)
-
-                        # Update raw component to use semantic color
-                        raw_comp.color_class = semantic_color
-
-                        expanded_comp = GlossComponent(
-                            text=component,
-                            component_type="case_spec",
-                            color_class=semantic_color,
-                            description=description,
-                        )
-                    else:
-                        # Other special components (auxiliary, modifiers)
-                        expanded_comp = GlossComponent(
-                            text=component,
-                            component_type=component_type,
-                            color_class=color_class,
-                            description=description,
-                        )
-                    expanded_components.append(expanded_comp)
-                else:
-                    # Regular component
-                    expanded_comp = GlossComponent(
+                expanded_components.append(
+                    GlossComponent(
                         text=component,
                         component_type=component_type,
                         color_class=color_class,
                         description=description,
                     )
-                    expanded_components.append(expanded_comp)
+                )
 
         return GlossData(
             raw_components=raw_components,
@@ -175,31 +237,14 @@ class RobustGlossProcessor(BaseGlossParser):
             return self.gloss_reference[component]
 
         # Fallback descriptions for basic components
-        descriptions = {
-            "V": "Verb",
-            "Act": "Active",
-            "Med": "Medial",
-            "Pass": "Passive",
-            "MedAct": "Medial Active",
-            "MedPass": "Medial Passive",
-            "Pres": "Present",
-            "Impf": "Imperfect",
-            "Fut": "Future",
-            "Aor": "Aorist",
-            "Opt": "Optative",
-            "Impv": "Imperative",
-            "Inv": "Inverted",
-            "Pv": preverb if preverb else "Preverb",
-            "AuxIntr": "Auxiliary Intransitive",
-            "AuxTrans": "Auxiliary Transitive",
-            "AuxTransHum": "Auxiliary Transitive Human",
-        }
-
-        if component in descriptions:
-            return descriptions[component]
+        if component == "Pv":
+            return preverb if preverb else "Preverb"
+        description = _COMPONENT_DESCRIPTIONS.get(component)
+        if description is not None:
+            return description
 
         # Handle argument patterns and case specifications that might not be in gloss reference
-        if component.startswith("<") and component.endswith(">"):
+        if component[:1] == "<" and component[-1:] == ">":
             if self._is_case_specification(component):
                 # Case specification like <S:Nom> - try to construct a reasonable description
                 role, case = component[1:-1].split(":", 1)
@@ -208,13 +253,7 @@ class RobustGlossProcessor(BaseGlossParser):
                 return role_desc
             elif self._is_argument_pattern(component):
                 # Argument pattern like <S-DO> - try to construct a reasonable description
-                pattern_descriptions = {
-                    "<S>": "Intransitive absolute",
-                    "<S-DO>": "Transitive absolute",
-                    "<S-IO>": "Ditransitive (Subject-Indirect Object)",
-                    "<S-DO-IO>": "Ditransitive (Subject-Direct Object-Indirect Object)",
-                }
-                return pattern_descriptions.get(component, "Argument pattern")
+                return _PATTERN_DESCRIPTIONS.get(component, "Argument pattern")
 
         return component
 
@@ -231,7 +270,7 @@ class RobustGlossProcessor(BaseGlossParser):
         Returns:
             List of GlossComponent objects with appropriate colors
         """
-        if not (component.startswith("<") and component.endswith(">")):
+        if not (component[:1] == "<" and component[-1:] == ">"):
             # Not an argument pattern - return as single component
             return [
                 GlossComponent(
@@ -278,22 +317,17 @@ class RobustGlossProcessor(BaseGlossParser):
         Returns:
             Tuple of (color_class, description)
         """
-        argument_mapping = {
-            "S": ("gloss-subject", "Subject"),
-            "DO": ("gloss-direct-object", "Direct Object"),
-            "IO": ("gloss-indirect-object", "Indirect Object"),
-            # Add more argument types as needed
-            "A": ("gloss-agent", "Agent"),
-            "P": ("gloss-patient", "Patient"),
-            "T": ("gloss-theme", "Theme"),
-            "R": ("gloss-recipient", "Recipient"),
-        }
-
-        return argument_mapping.get(
+        return _ARGUMENT_TYPE_STYLES.get(
             arg_type, ("gloss-argument", f"{arg_type} argument")
         )
 
 
+@lru_cache(maxsize=None)
+def _get_gloss_processor() -> RobustGlossProcessor:
+    """Return the shared processor so the gloss reference is read from disk once."""
+    return RobustGlossProcessor()
+
+
 def create_gloss_data_structure(raw_gloss: str, preverb: str = None) -> Dict:
     """
     Create a data structure for gloss information.
@@ -306,7 +340,7 @@ def create_gloss_data_structure(raw_gloss: str, preverb: str = None) -> Dict:
         Dictionary with structured gloss data
     """
 
-    processor = RobustGlossProcessor()
+    processor = _get_gloss_processor()
     gloss_data = processor.parse_raw_gloss(raw_gloss, preverb)
 
     # Convert to serializable format
@@ -7,6 +7,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, Optional
+from build.utils.common_utils import load_json_file
 from build.utils.unicode_console import safe_log
 
 logger = logging.getLogger(__name__)
@@ -47,8 +48,7 @@ class ProcessedDataManager:
             return {}
 
         try:
-            with open(self.processed_verbs_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(self.processed_verbs_file)
 
             safe_log(
                 logger,
@@ -10,18 +10,256 @@ This module:
 5. Handles the modular JavaScript system
 """
 
+import errno
+import hashlib
+import os
 import shutil
+import stat
+import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Linux ioctl that makes a copy-on-write clone of a file (btrfs, XFS); other
+# platforms clone differently (macOS uses clonefile), so only try it on Linux
+_FICLONE = 0x40049409
+_REFLINK_SUPPORTED = fcntl is not None and sys.platform.startswith("linux")
+
+# Errors meaning the filesystem can't reflink between these devices at all
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY}
+)
+
+# (source, dest) device pairs that refused FICLONE, so later files skip it
+_no_reflink_devices = set()
+
+
+def _file_digest(path: Path) -> bytes:
+    """Hash a file's contents with BLAKE2b-128."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(
+                f, lambda: hashlib.blake2b(digest_size=16)
+            ).digest()
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def _clone_or_copy(source: Path, dest: Path, link: bool = False) -> None:
+    """
+    Give dest the contents and metadata of source as cheaply as possible.
+
+    With link set, a hardlink is made when both sit on the same filesystem,
+    so dest shares source's inode. Otherwise a copy-on-write reflink is tried
+    before falling back to a regular copy2.
+    """
+    # Never write through an existing dest, which may share source's inode
+    dest.unlink(missing_ok=True)
+
+    if link:
+        try:
+            if source.stat().st_dev == dest.parent.stat().st_dev:
+                os.link(source, dest)
+                return
+        except OSError:
+            pass
+
+    if _REFLINK_SUPPORTED:
+        devices = (source.stat().st_dev, dest.parent.stat().st_dev)
+        if devices not in _no_reflink_devices:
+            try:
+                with open(source, "rb") as src, open(dest, "wb") as dst:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            except OSError as e:
+                dest.unlink(missing_ok=True)
+                if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                    _no_reflink_devices.add(devices)
+            else:
+                shutil.copystat(source, dest)
+                return
+
+    shutil.copy2(source, dest)
+
+
+def _needs_copy(source: Path, dest: Path, refresh_stat: bool = False) -> bool:
+    """
+    Check whether dest is missing or differs in contents from source.
+
+    A matching size and modification time (which copy2 preserves) counts as
+    unchanged. When only the timestamps differ, as after a git checkout, the
+    contents are compared by hash; with refresh_stat an identical file gets
+    its metadata refreshed so the next check is a plain stat.
+
+    Returns:
+        bool: True if dest needs to be (re)written
+    """
+    try:
+        dest_stat = dest.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        # Missing, or a parent in dist is a file that a sync would replace
+        return True
+    if not stat.S_ISREG(dest_stat.st_mode):
+        return True
+
+    source_stat = source.stat()
+    if source_stat.st_size != dest_stat.st_size:
+        return True
+    if source_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return False
+    if _file_digest(source) != _file_digest(dest):
+        return True
+    if refresh_stat:
+        shutil.copystat(source, dest)
+    return False
+
+
+def _copy_if_changed(source: Path, dest: Path, link: bool = False) -> bool:
+    """
+    Copy source to dest with its metadata unless dest already has its contents.
+
+    Returns:
+        bool: True if the file was copied, False if it was skipped
+    """
+    if not _needs_copy(source, dest, refresh_stat=True):
+        return False
+    _clone_or_copy(source, dest, link)
+    return True
+
+
+def _plan_tree(
+    source_dir: Path,
+    dest_dir: Path,
+    pairs: List[Tuple[Path, Path]],
+    removals: Optional[List[Path]] = None,
+) -> None:
+    """
+    Prepare dest_dir to mirror source_dir and collect the files to sync.
+
+    Directories are created and stale entries removed here, serially, so the
+    copies themselves can run concurrently without racing on mkdir or rmtree.
+    When a removals list is passed nothing is touched: the entries a real run
+    would delete are appended to it instead, for a dry run.
+    """
+    dry_run = removals is not None
+
+    dest_is_dir = dest_dir.is_dir() and not dest_dir.is_symlink()
+    if dest_dir.is_symlink() or dest_dir.is_file():
+        if dry_run:
+            removals.append(dest_dir)
+        else:
+            dest_dir.unlink()
+    if not dry_run:
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        dest_is_dir = True
+
+    source_names = set()
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            source_names.add(entry.name)
+            source_path = Path(entry.path)
+            dest_path = dest_dir / entry.name
+            # Follow symlinks like copytree does by default
+            if entry.is_dir():
+                _plan_tree(source_path, dest_path, pairs, removals)
+                continue
+            if dest_is_dir and dest_path.is_dir() and not dest_path.is_symlink():
+                if dry_run:
+                    removals.append(dest_path)
+                else:
+                    shutil.rmtree(dest_path)
+            pairs.append((source_path, dest_path))
+
+    if not dest_is_dir:
+        return
+
+    # Drop files and directories that were removed from the source
+    with os.scandir(dest_dir) as entries:
+        for entry in entries:
+            if entry.name in source_names:
+                continue
+            if dry_run:
+                removals.append(Path(entry.path))
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _sync_tree(
+    source_dir: Path, dest_dir: Path, max_workers: int = 1, link: bool = False
+) -> int:
+    """
+    Mirror source_dir into dest_dir, copying only files that changed.
+
+    Unchanged files are left in place and anything in dest_dir that no longer
+    exists in source_dir is removed, so the result matches a fresh copytree.
+    With max_workers above 1 the per-file copies run on a thread pool, which
+    also caps how many files are open at once.
+
+    Returns:
+        int: Number of files copied
+    """
+    pairs: List[Tuple[Path, Path]] = []
+    _plan_tree(source_dir, dest_dir, pairs)
+
+    if max_workers <= 1 or len(pairs) <= 1:
+        return sum(_copy_if_changed(source, dest, link) for source, dest in pairs)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        return sum(executor.map(lambda pair: _copy_if_changed(*pair, link), pairs))
+
+
+def _dir_entries(path: Path) -> set:
+    """
+    Names of the entries in a directory, read with a single scandir.
+
+    Returns:
+        set: Entry names, or an empty set if the directory doesn't exist
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 
 class AssetManager:
     """Handles copying and management of static assets for the website."""
 
-    def __init__(self, project_root: Path, config_manager=None):
+    def __init__(
+        self,
+        project_root: Path,
+        config_manager=None,
+        fail_fast: bool = True,
+        dry_run: bool = False,
+    ):
+        """
+        Initialize the asset manager.
+
+        Args:
+            project_root: Path to project root
+            config_manager: Optional ConfigManager; created from project_root if None
+            fail_fast: Stop at the first failed copy step; pass False to run
+                the remaining steps anyway
+            dry_run: Only record which files would be copied or removed (see
+                get_plan and get_planned_removals) without writing anything
+        """
+        self.fail_fast = fail_fast
+        self.dry_run = dry_run
+        self.planned_copies: List[Tuple[Path, Path]] = []
+        self.planned_removals: List[Path] = []
+
         if config_manager is None:
             # Import here to avoid circular imports
             from build.utils.config_manager import ConfigManager
@@ -33,6 +271,80 @@ class AssetManager:
         # Get all paths from config manager
         self.dist_dir = self.config_manager.get_path("dist_dir")
         self.src_dir = self.config_manager.get_path("src_dir")
+        self.parallel_workers = self.config_manager.get_setting(
+            "asset_config", "parallel_workers"
+        )
+
+        # Hardlink CSS, JS, assets and the 404 page into dist instead of
+        # copying them; nothing in the build rewrites them afterwards
+        self.link_static_assets = self.config_manager.get_setting(
+            "asset_config", "link_static_assets"
+        )
+
+        # Directories already created by this instance
+        self._created_dirs = set()
+
+        # Step log wording, so a dry run doesn't claim to have written files
+        self._copied = "would be copied" if dry_run else "copied"
+        self._synced = "checked" if dry_run else "copied"
+        self._updated = "would be updated" if dry_run else "updated"
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) once per instance."""
+        if self.dry_run or path in self._created_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(path)
+
+    def _copy_one(self, source: Path, dest: Path, link: bool = False) -> bool:
+        """
+        Copy a single file if it changed, or just record it in a dry run.
+
+        Returns:
+            bool: True if the file was (or would be) copied
+        """
+        if self.dry_run:
+            if not _needs_copy(source, dest):
+                return False
+            self.planned_copies.append((source, dest))
+            return True
+        return _copy_if_changed(source, dest, link)
+
+    def _sync(self, source_dir: Path, dest_dir: Path, link: bool = False) -> int:
+        """
+        Mirror a source directory into dist, or just record its changes in a dry run.
+
+        Returns:
+            int: Number of files copied (or that would be copied)
+        """
+        if not self.dry_run:
+            return _sync_tree(source_dir, dest_dir, self.parallel_workers, link)
+
+        pairs: List[Tuple[Path, Path]] = []
+        _plan_tree(source_dir, dest_dir, pairs, self.planned_removals)
+        return sum(self._copy_one(source, dest) for source, dest in pairs)
+
+    def get_plan(self) -> List[Tuple[Path, Path]]:
+        """
+        Get the copies recorded by a dry-run copy_assets().
+
+        Returns:
+            List[Tuple[Path, Path]]: (source, dest) pairs that would be copied
+        """
+        return sorted(self.planned_copies)
+
+    def get_planned_removals(self) -> List[Path]:
+        """
+        Get the stale dist entries a dry-run copy_assets() found.
+
+        These are files or directories a real run would delete, either because
+        their source is gone or because they block a file or directory of the
+        same name.
+
+        Returns:
+            List[Path]: Paths that would be removed
+        """
+        return sorted(self.planned_removals)
 
     def copy_assets(self) -> bool:
         """
@@ -42,27 +354,37 @@ class AssetManager:
             bool: True if successful, False otherwise
         """
         try:
-            logger.info("📋 Starting asset copy process...")
+            logger.info(
+                "📋 Starting asset copy process"
+                + (" (dry run)..." if self.dry_run else "...")
+            )
+            self.planned_copies.clear()
+            self.planned_removals.clear()
 
             # Create main dist directory
-            self.dist_dir.mkdir(exist_ok=True)
-
-            # Copy CSS and JS files
-            css_success = self._copy_css_files()
-            js_success = self._copy_js_files()
-
-            # Copy assets folder (fonts, etc.)
-            assets_success = self._copy_assets_folder()
-
-            # Copy 404 page
-            error_page_success = self._copy_error_page()
-
-            # Check if all operations were successful
-            all_successful = all(
-                [css_success, js_success, assets_success, error_page_success]
+            self._ensure_dir(self.dist_dir)
+
+            # CSS, JS, assets folder (fonts, etc.) and 404 page; the steps run
+            # in turn so only the per-file copies within them use the thread
+            # pool, keeping concurrency bounded by parallel_workers
+            copy_steps = (
+                self._copy_css_files,
+                self._copy_js_files,
+                self._copy_assets_folder,
+                self._copy_error_page,
             )
+            if self.fail_fast:
+                # all() short-circuits, skipping the steps after a failure
+                all_successful = all(step() for step in copy_steps)
+            else:
+                all_successful = all([step() for step in copy_steps])
 
-            if all_successful:
+            if self.dry_run:
+                logger.info(
+                    f"📋 Dry run: {len(self.planned_copies)} files would be copied, "
+                    f"{len(self.planned_removals)} stale entries removed"
+                )
+            elif all_successful:
                 logger.info("📋 All assets copied successfully")
             else:
                 logger.warning("⚠️ Some assets failed to copy")
@@ -86,11 +408,13 @@ class AssetManager:
             css_dest = self.config_manager.get_path("css_output")
 
             # Create directory if needed
-            css_dest.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(css_dest.parent)
 
             if css_source.exists():
-                shutil.copy2(css_source, css_dest)
-                logger.info("  ✅ CSS files copied")
+                if self._copy_one(css_source, css_dest, self.link_static_assets):
+                    logger.info(f"  ✅ CSS files {self._copied}")
+                else:
+                    logger.info("  ✅ CSS files up to date")
                 return True
             else:
                 logger.warning(f"  ⚠️ CSS source file not found: {css_source}")
@@ -111,15 +435,17 @@ class AssetManager:
         try:
             # Use config manager paths
             scripts_dir = self.config_manager.get_path("dist_scripts_dir")
-            scripts_dir.mkdir(exist_ok=True)
+            self._ensure_dir(scripts_dir)
 
             # Copy main orchestrator file
             main_source = self.config_manager.get_path("js_file")
             main_dest = self.config_manager.get_path("js_output")
 
             if main_source.exists():
-                shutil.copy2(main_source, main_dest)
-                logger.info("  ✅ Main JavaScript orchestrator copied")
+                if self._copy_one(main_source, main_dest, self.link_static_assets):
+                    logger.info(f"  ✅ Main JavaScript orchestrator {self._copied}")
+                else:
+                    logger.info("  ✅ Main JavaScript orchestrator up to date")
             else:
                 logger.warning(f"  ⚠️ Main JavaScript source not found: {main_source}")
                 return False
@@ -129,10 +455,12 @@ class AssetManager:
             shared_dest = scripts_dir / "shared"
 
             if shared_source.exists():
-                if shared_dest.exists():
-                    shutil.rmtree(shared_dest)
-                shutil.copytree(shared_source, shared_dest)
-                logger.info("  ✅ Shared utilities copied")
+                copied = self._sync(
+                    shared_source, shared_dest, self.link_static_assets
+                )
+                logger.info(
+                    f"  ✅ Shared utilities {self._synced} ({copied} {self._updated})"
+                )
             else:
                 logger.warning(
                     f"  ⚠️ Shared utilities directory not found: {shared_source}"
@@ -144,17 +472,19 @@ class AssetManager:
             modules_dest = scripts_dir / "modules"
 
             if modules_source.exists():
-                if modules_dest.exists():
-                    shutil.rmtree(modules_dest)
-                shutil.copytree(modules_source, modules_dest)
-                logger.info("  ✅ Feature modules copied")
+                copied = self._sync(
+                    modules_source, modules_dest, self.link_static_assets
+                )
+                logger.info(
+                    f"  ✅ Feature modules {self._synced} ({copied} {self._updated})"
+                )
             else:
                 logger.warning(
                     f"  ⚠️ Feature modules directory not found: {modules_source}"
                 )
                 return False
 
-            logger.info("  ✅ All JavaScript files copied successfully")
+            logger.info(f"  ✅ All JavaScript files {self._synced} successfully")
             return True
 
         except Exception as e:
@@ -174,13 +504,11 @@ class AssetManager:
             assets_dest = self.config_manager.get_path("dist_assets_dir")
 
             if assets_source.exists():
-                # Remove existing assets directory if it exists
-                if assets_dest.exists():
-                    shutil.rmtree(assets_dest)
-
-                # Copy the entire assets directory
-                shutil.copytree(assets_source, assets_dest)
-                logger.info("  ✅ Assets folder copied")
+                # Mirror the assets directory, rewriting only changed files
+                copied = self._sync(assets_source, assets_dest, self.link_static_assets)
+                logger.info(
+                    f"  ✅ Assets folder {self._synced} ({copied} {self._updated})"
+                )
                 return True
             else:
                 logger.info("  ℹ️ No assets folder found (this is optional)")
@@ -203,8 +531,12 @@ class AssetManager:
             error_page_dest = self.config_manager.get_path("error_page_output")
 
             if error_page_source.exists():
-                shutil.copy2(error_page_source, error_page_dest)
-                logger.info("  ✅ 404 page copied")
+                if self._copy_one(
+                    error_page_source, error_page_dest, self.link_static_assets
+                ):
+                    logger.info(f"  ✅ 404 page {self._copied}")
+                else:
+                    logger.info("  ✅ 404 page up to date")
                 return True
             else:
                 logger.info("  ℹ️ No 404 page found (this is optional)")
@@ -214,9 +546,30 @@ class AssetManager:
             logger.error(f"  ❌ Error copying 404 page: {e}")
             return False
 
-    def get_asset_paths(self) -> dict:
+    @cached_property
+    def scripts_dir(self) -> Path:
+        """Output directory for JavaScript files."""
+        return self.config_manager.get_path("dist_scripts_dir")
+
+    @cached_property
+    def shared_dir(self) -> Path:
+        """Output directory for shared JavaScript utilities."""
+        return self.scripts_dir / "shared"
+
+    @cached_property
+    def modules_dir(self) -> Path:
+        """Output directory for JavaScript feature modules."""
+        return self.scripts_dir / "modules"
+
+    @cached_property
+    def js_file(self) -> Path:
+        """Output path of the main JavaScript orchestrator."""
+        return self.config_manager.get_path("js_output")
+
+    @cached_property
+    def asset_paths(self) -> dict:
         """
-        Get the paths of all asset directories and files.
+        Paths of all asset directories and files, built once per instance.
 
         Returns:
             dict: Dictionary containing asset paths
@@ -224,20 +577,27 @@ class AssetManager:
         return {
             "dist_dir": self.dist_dir,
             "styles_dir": self.config_manager.get_path("dist_styles_dir"),
-            "scripts_dir": self.config_manager.get_path("dist_scripts_dir"),
+            "scripts_dir": self.scripts_dir,
             "assets_dir": self.config_manager.get_path("dist_assets_dir"),
             "css_file": self.config_manager.get_path("css_output"),
-            "js_file": self.config_manager.get_path("js_output"),
+            "js_file": self.js_file,
             "error_page": self.config_manager.get_path("error_page_output"),
             # Modular structure paths
-            "shared_dir": self.config_manager.get_path("dist_scripts_dir") / "shared",
-            "modules_dir": self.config_manager.get_path("dist_scripts_dir") / "modules",
-            "test_config": self.config_manager.get_path("dist_scripts_dir")
-            / "test-config.js",
-            "build_production": self.config_manager.get_path("dist_scripts_dir")
-            / "build-production.js",
+            "shared_dir": self.shared_dir,
+            "modules_dir": self.modules_dir,
+            "test_config": self.scripts_dir / "test-config.js",
+            "build_production": self.scripts_dir / "build-production.js",
         }
 
+    def get_asset_paths(self) -> dict:
+        """
+        Get the paths of all asset directories and files.
+
+        Returns:
+            dict: Dictionary containing asset paths
+        """
+        return self.asset_paths
+
     def validate_assets(self) -> Tuple[bool, List[str]]:
         """
         Validate that all required assets exist in the dist directory.
@@ -247,7 +607,7 @@ class AssetManager:
             Tuple[bool, List[str]]: (success, list of missing files)
         """
         missing_files = []
-        paths = self.get_asset_paths()
+        paths = self.asset_paths
 
         # Check required files
         required_files = [
@@ -265,18 +625,20 @@ class AssetManager:
         shared_files = self.config_manager.get_setting(
             "asset_config", "required_shared_files"
         )
+        shared_present = _dir_entries(paths["shared_dir"])
         for shared_file in shared_files:
-            shared_path = paths["shared_dir"] / shared_file
-            if not shared_path.exists():
+            if shared_file not in shared_present:
+                shared_path = paths["shared_dir"] / shared_file
                 missing_files.append(f"Shared utility {shared_file}: {shared_path}")
 
         # Check required feature module files using config
         feature_modules = self.config_manager.get_setting(
             "asset_config", "required_feature_modules"
         )
+        modules_present = _dir_entries(paths["modules_dir"])
         for module_file in feature_modules:
-            module_path = paths["modules_dir"] / module_file
-            if not module_path.exists():
+            if module_file not in modules_present:
+                module_path = paths["modules_dir"] / module_file
                 missing_files.append(f"Feature module {module_file}: {module_path}")
 
         # Optional files (just log if missing)
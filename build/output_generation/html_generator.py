@@ -10,8 +10,12 @@ import html
 
 import re
 
+from functools import lru_cache
+
 from pathlib import Path
 
+from types import MappingProxyType
+
 from typing import Dict, List, Optional
 
 import logging
@@ -19,9 +23,53 @@ import logging
 
 from build.data_processing.processed_data_manager import ProcessedDataManager
 
+from build.utils.common_utils import load_json_file
+
 
 logger = logging.getLogger(__name__)
 
+# Raw gloss elements containing any of these markers are verb properties;
+# one alternation scans each element once instead of once per marker
+_VERB_PROPERTY_RE = re.compile(r"V|Act|Impf|Perf")
+
+# Expanded gloss category for each component type; other types are verb properties
+_EXPANDED_GLOSS_CATEGORIES = MappingProxyType(
+    {
+        "verb": "Verb Properties",
+        "voice": "Verb Properties",
+        "tense": "Screve",
+        "aspect": "Screve",
+        "argument": "Argument Structure",
+        "case_spec": "Case Marking",
+    }
+)
+
+# Fallback descriptions for argument patterns missing from the gloss reference
+_ARGUMENT_PATTERN_DESCRIPTIONS = MappingProxyType(
+    {
+        "<S-DO>": "Transitive absolute",
+        "<S-DO-IO>": "Transitive relative",
+        "<S-IO>": "Intransitive relative",
+    }
+)
+
+# CSS class for each example component role; unknown roles fall back to gloss-default
+_COMPONENT_CSS_CLASSES = MappingProxyType(
+    {
+        "verb": "gloss-verb",
+        "subject": "gloss-subject",
+        "direct_object": "gloss-direct-object",
+        "indirect_object": "gloss-indirect-object",
+    }
+)
+
+
+@lru_cache(maxsize=1024)
+def _gloss_span(text: str, color_class: str) -> str:
+    """Render one colored gloss token, escaping angle brackets so they display as literal text."""
+    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
+    return f'<span class="{color_class}">{escaped_text}</span>'
+
 
 class ProcessedDataAccessor:
     """Helper class to handle data access patterns and reduce coupling to data structure."""
@@ -157,11 +205,12 @@ class HTMLGenerator:
         self.processed_data_manager = ProcessedDataManager(project_root)
         self.gloss_reference = self._load_gloss_reference()
 
+        # Structured gloss HTML keyed by raw gloss; verbs share a small set of glosses
+        self._structured_gloss_cache: Dict[str, str] = {}
+
     def _load_gloss_reference(self) -> Dict:
         """Load gloss reference data for argument pattern mapping."""
         try:
-            import json
-
             gloss_ref_path = (
                 self.project_root
                 / "apps"
@@ -171,8 +220,7 @@ class HTMLGenerator:
                 / "gloss_reference.json"
             )
             if gloss_ref_path.exists():
-                with open(gloss_ref_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return load_json_file(gloss_ref_path)
             else:
                 logger.warning(f"Gloss reference file not found at {gloss_ref_path}")
                 return {}
@@ -1476,13 +1524,7 @@ class HTMLGenerator:
 
     def _get_component_css_class(self, role: str, language: str) -> str:
         """Get CSS class name for component styling, matching the demo approach."""
-        class_map = {
-            "verb": "gloss-verb",
-            "subject": "gloss-subject",
-            "direct_object": "gloss-direct-object",
-            "indirect_object": "gloss-indirect-object",
-        }
-        return class_map.get(role, "gloss-default")
+        return _COMPONENT_CSS_CLASSES.get(role, "gloss-default")
 
     def _format_verb_component(self, verb_data: Dict) -> str:
         """Format verb component."""
@@ -1643,6 +1685,21 @@ class HTMLGenerator:
 
             return ""
 
+    def _format_argument_pattern_group(self, component: Dict) -> str:
+        """Render a grouped argument pattern like <S-DO> as adjacent colored spans."""
+        group_parts = []
+        for group_comp in component.get("components", []):
+            if hasattr(group_comp, "text"):
+                text = group_comp.text
+                color_class = group_comp.color_class
+            else:
+                text = group_comp.get("text", "")
+                color_class = group_comp.get("color_class", "gloss-default")
+            group_parts.append(_gloss_span(text, color_class))
+
+        # Join group components without spaces
+        return "".join(group_parts)
+
     def _generate_raw_gloss_section(self, raw_components: List[Dict]) -> str:
         """Generate the raw gloss section with monospaced font and color coding."""
 
@@ -1665,37 +1722,7 @@ class HTMLGenerator:
 
                 # Handle grouped argument pattern without spaces
 
-                group_components = component.get("components", [])
-
-                group_parts = []
-
-                for group_comp in group_components:
-
-                    if hasattr(group_comp, "text"):
-
-                        text = group_comp.text
-
-                        color_class = group_comp.color_class
-
-                    else:
-
-                        text = group_comp.get("text", "")
-
-                        color_class = group_comp.get("color_class", "gloss-default")
-
-                    # Escape angle brackets so they display as literal text
-
-                    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-
-                    group_parts.append(
-                        f'<span class="{color_class}">{escaped_text}</span>'
-                    )
-
-                # Join group components without spaces
-
-                grouped_html = "".join(group_parts)
-
-                colored_parts.append(grouped_html)
+                colored_parts.append(self._format_argument_pattern_group(component))
 
             else:
 
@@ -1713,13 +1740,7 @@ class HTMLGenerator:
 
                     color_class = component.get("color_class", "gloss-default")
 
-                    # Escape angle brackets so they display as literal text
-
-                    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-
-                    colored_parts.append(
-                        f'<span class="{color_class}">{escaped_text}</span>'
-                    )
+                colored_parts.append(_gloss_span(text, color_class))
 
         # Join components with spaces for proper formatting
 
@@ -1744,7 +1765,7 @@ class HTMLGenerator:
 
             return ""
 
-        # Build expanded gloss
+        # Build expanded gloss, one entry per component
 
         expanded_parts = []
 
@@ -1759,46 +1780,10 @@ class HTMLGenerator:
 
                 # Handle grouped argument pattern without spaces
 
-                group_components = component.get("components", [])
-
-                colored_parts = []
-
-                for group_comp in group_components:
-
-                    if hasattr(group_comp, "text"):
-
-                        text = group_comp.text
-
-                        color_class = group_comp.color_class
-
-                    else:
-
-                        text = group_comp.get("text", "")
-
-                        color_class = group_comp.get("color_class", "gloss-default")
-
-                    # Escape angle brackets so they display as literal text
-
-                    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-
-                    colored_parts.append(
-                        f'<span class="{color_class}">{escaped_text}</span>'
-                    )
-
-                colored_text = "".join(colored_parts)
+                colored_text = self._format_argument_pattern_group(component)
 
                 description = component.get("description", "")
 
-                # Add description for the grouped component
-
-                if description and description.strip():
-
-                    expanded_parts.append(f"{colored_text}: {description}")
-
-                else:
-
-                    expanded_parts.append(colored_text)
-
             else:
 
                 # Handle regular components
@@ -1819,9 +1804,7 @@ class HTMLGenerator:
 
                     description = component.get("description", "")
 
-                    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-
-                    colored_text = f'<span class="{color_class}">{escaped_text}</span>'
+                colored_text = _gloss_span(text, color_class)
 
             # Only add description for components that have meaningful descriptions
 
@@ -2215,6 +2198,14 @@ class HTMLGenerator:
 
     def _build_structured_gloss(self, raw_gloss: str) -> str:
         """Build structured gloss from raw gloss text."""
+        structured_html = self._structured_gloss_cache.get(raw_gloss)
+        if structured_html is None:
+            structured_html = self._build_structured_gloss_uncached(raw_gloss)
+            self._structured_gloss_cache[raw_gloss] = structured_html
+        return structured_html
+
+    def _build_structured_gloss_uncached(self, raw_gloss: str) -> str:
+        """Build structured gloss HTML without consulting the memo cache."""
         elements = raw_gloss.split(" ")
         categories = {
             "Verb Properties": [],
@@ -2224,7 +2215,7 @@ class HTMLGenerator:
         }
 
         for element in elements:
-            if any(keyword in element for keyword in ["V", "Act", "Impf", "Perf"]):
+            if _VERB_PROPERTY_RE.search(element):
                 categories["Verb Properties"].append(element)
             elif "<" in element and ">" in element:
                 if ":" in element:
@@ -2234,10 +2225,11 @@ class HTMLGenerator:
             else:
                 categories["Tense & Aspect"].append(element)
 
-        structured_html = ""
+        category_parts = []
         for category, items in categories.items():
             if items:
-                structured_html += f"""
+                category_parts.append(
+                    f"""
                     <div class="gloss-category">
                         <div class="gloss-category-title">{category}</div>
                         <div class="gloss-category-items">
@@ -2245,8 +2237,9 @@ class HTMLGenerator:
                         </div>
                     </div>
                 """
+                )
 
-        return structured_html
+        return "".join(category_parts)
 
     def _generate_styled_raw_gloss(self, raw_components: List[Dict]) -> str:
         """Generate styled raw gloss from structured components, following the demo approach."""
@@ -2262,32 +2255,13 @@ class HTMLGenerator:
                 and component.get("type") == "argument_pattern_group"
             ):
                 # Handle grouped argument pattern without spaces
-                group_components = component.get("components", [])
-                group_parts = []
-
-                for group_comp in group_components:
-                    text = group_comp.get("text", "")
-                    color_class = group_comp.get("color_class", "gloss-default")
-
-                    # Escape angle brackets so they display as literal text
-                    escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-                    group_parts.append(
-                        f'<span class="{color_class}">{escaped_text}</span>'
-                    )
-
-                # Join group components without spaces
-                grouped_html = "".join(group_parts)
-                styled_parts.append(grouped_html)
+                styled_parts.append(self._format_argument_pattern_group(component))
             else:
                 # Handle regular components
                 text = component.get("text", "")
                 color_class = component.get("color_class", "gloss-default")
 
-                # Escape angle brackets so they display as literal text
-                escaped_text = text.replace("<", "&lt;").replace(">", "&gt;")
-                styled_parts.append(
-                    f'<span class="{color_class}">{escaped_text}</span>'
-                )
+                styled_parts.append(_gloss_span(text, color_class))
 
         # Join components with spaces for proper formatting
         return " ".join(styled_parts)
@@ -2316,55 +2290,44 @@ class HTMLGenerator:
             # Handle argument pattern components specially
             if (
                 component_type == "argument"
-                and text.startswith("<")
-                and text.endswith(">")
+                and text[:1] == "<"
+                and text[-1:] == ">"
             ):
                 # Look up description from gloss reference
                 description = self.gloss_reference.get(text, "")
                 if not description:
                     # Fallback to common patterns
-                    if text == "<S-DO>":
-                        description = "Transitive absolute"
-                    elif text == "<S-DO-IO>":
-                        description = "Transitive relative"
-                    elif text == "<S-IO>":
-                        description = "Intransitive relative"
-
-            # Categorize components
-            if component_type in ["verb", "voice"]:
-                categories["Verb Properties"].append((text, color_class, description))
-            elif component_type in ["tense", "aspect"]:
-                categories["Screve"].append(
-                    (text, color_class, description)
-                )  # Use "Screve"
-            elif component_type == "argument":
-                categories["Argument Structure"].append(
-                    (text, color_class, description)
-                )
-            elif component_type == "case_spec":
-                categories["Case Marking"].append((text, color_class, description))
-            else:
-                # Default to Verb Properties for unknown types
-                categories["Verb Properties"].append((text, color_class, description))
+                    description = _ARGUMENT_PATTERN_DESCRIPTIONS.get(text, description)
+
+            # Categorize components, defaulting to Verb Properties for unknown types
+            category = _EXPANDED_GLOSS_CATEGORIES.get(component_type, "Verb Properties")
+            categories[category].append((text, color_class, description))
 
         # Generate HTML for each category with consistent font styling
-        structured_html = ""
+        # Collect the pieces and join once instead of growing strings in the loop
+        category_parts = []
         for category_name, items in categories.items():
             if items:
-                items_html = ""
+                item_parts = []
                 for text, color_class, description in items:
                     # Don't escape argument patterns - they should display as literal text
-                    if text.startswith("<") and text.endswith(">"):
+                    if text[:1] == "<" and text[-1:] == ">":
                         display_text = text
                     else:
                         display_text = text.replace("<", "&lt;").replace(">", "&gt;")
 
                     if description and description.strip():
-                        items_html += f'<div class="gloss-element"><span class="gloss-brackets {color_class}" style="font-family: \'Courier New\', monospace;">{display_text}</span>: <span style="font-family: \'Courier New\', monospace;">{description}</span></div>'
+                        item_parts.append(
+                            f'<div class="gloss-element"><span class="gloss-brackets {color_class}" style="font-family: \'Courier New\', monospace;">{display_text}</span>: <span style="font-family: \'Courier New\', monospace;">{description}</span></div>'
+                        )
                     else:
-                        items_html += f'<div class="gloss-element"><span class="gloss-brackets {color_class}" style="font-family: \'Courier New\', monospace;">{display_text}</span></div>'
+                        item_parts.append(
+                            f'<div class="gloss-element"><span class="gloss-brackets {color_class}" style="font-family: \'Courier New\', monospace;">{display_text}</span></div>'
+                        )
+                items_html = "".join(item_parts)
 
-                structured_html += f"""
+                category_parts.append(
+                    f"""
                     <div class="gloss-category">
                         <div class="gloss-category-title" style="font-family: \'Courier New\', monospace;">{category_name}</div>
                         <div class="gloss-category-items">
@@ -2372,8 +2335,9 @@ class HTMLGenerator:
                         </div>
                     </div>
                 """
+                )
 
-        return structured_html
+        return "".join(category_parts)
 
     def _generate_critical_css(self) -> str:
         """
@@ -13,6 +13,7 @@ from .common_utils import (
     create_deterministic_hash,
     get_primary_verb,
     create_safe_anchor_id,
+    load_json_file,
 )
 from .shared_gloss_utils import BaseGlossParser, GlossComponent, GlossData
 from .unicode_console import (
@@ -28,6 +29,7 @@ __all__ = [
     "create_deterministic_hash",
     "get_primary_verb",
     "create_safe_anchor_id",
+    "load_json_file",
     "BaseGlossParser",
     "GlossComponent",
     "GlossData",
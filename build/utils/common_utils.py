@@ -9,11 +9,36 @@ import hashlib
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Union
+
+# orjson parses the large reference databases several times faster; it is
+# optional, so fall back to the standard library when it isn't installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Load a UTF-8 JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
 def create_deterministic_hash(text: str, salt: str = "") -> int:
     """
     Create a deterministic hash from text and optional salt.
@@ -16,6 +16,9 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Entries that mark a directory as the project root
+_PROJECT_ROOT_INDICATORS = frozenset({"apps", "tools", "dist"})
+
 
 class ConfigManager:
     """Manages configuration for the build process."""
@@ -38,12 +41,15 @@ class ConfigManager:
         """Auto-detect project root directory."""
         current_dir = Path.cwd()
 
-        # Look for common project indicators
-        indicators = ["apps", "tools", "dist"]
-
-        # Start from current directory and work up
+        # Start from current directory and work up, listing each candidate
+        # once instead of probing every indicator separately
         for path in [current_dir] + list(current_dir.parents):
-            if all((path / indicator).exists() for indicator in indicators):
+            try:
+                with os.scandir(path) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                continue
+            if _PROJECT_ROOT_INDICATORS <= names:
                 logger.info(f"📁 Detected project root: {path}")
                 return path
 
@@ -168,6 +174,12 @@ class ConfigManager:
             "copy_assets": True,
             "copy_error_page": True,
             "clean_existing_assets": True,
+            # Worker threads for per-file copies within asset directories
+            "parallel_workers": 4,
+            # Hardlink CSS, JS, assets and the 404 page into dist when src and
+            # dist share a filesystem; dist files then share inodes with their
+            # sources, so only enable this if nothing edits dist files in place
+            "link_static_assets": False,
             # Required file lists for validation
             "required_shared_files": [
                 "utils.js",
@@ -293,22 +305,25 @@ class ConfigManager:
         required_source_paths = ["css_file", "js_file"]
         for path_key in required_source_paths:
             path = self.get_path(path_key)
-            validation_results[f"source_{path_key}"] = path.exists()
-            if not path.exists():
+            exists = path.exists()
+            validation_results[f"source_{path_key}"] = exists
+            if not exists:
                 logger.warning(f"⚠️ Required source path missing: {path}")
 
         # Check optional source paths
         optional_source_paths = ["assets_dir", "error_page"]
         for path_key in optional_source_paths:
             path = self.get_path(path_key)
-            validation_results[f"source_{path_key}"] = path.exists()
-            if not path.exists():
+            exists = path.exists()
+            validation_results[f"source_{path_key}"] = exists
+            if not exists:
                 logger.info(f"ℹ️ Optional source path missing: {path}")
 
         # Check data paths
         data_path = self.get_path("verbs_json")
-        validation_results["data_verbs_json"] = data_path.exists()
-        if not data_path.exists():
+        exists = data_path.exists()
+        validation_results["data_verbs_json"] = exists
+        if not exists:
             logger.error(f"❌ Required data file missing: {data_path}")
 
         return validation_results
@@ -379,10 +394,9 @@ class ConfigManager:
             bool: True if successful, False otherwise
         """
         try:
-            import json
+            from build.utils.common_utils import load_json_file
 
-            with open(config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            config_data = load_json_file(config_file)
 
             # Update configuration with file data
             for category, settings in config_data.items():
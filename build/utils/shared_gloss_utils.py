@@ -10,6 +10,7 @@ This module provides the common foundation for both gloss processors:
 
 import logging
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -35,9 +36,25 @@ class GlossData:
     case_specifications: List[str] = None
 
 
+# Color class per "<Role" prefix of a case specification such as <S:Nom>
+_CASE_ROLE_COLORS = MappingProxyType(
+    {
+        "<S": "gloss-subject",
+        "<DO": "gloss-direct-object",
+        "<IO": "gloss-indirect-object",
+    }
+)
+
+
 class BaseGlossParser:
     """Base class providing shared parsing logic for both gloss processors."""
 
+    # Supported cases and patterns (membership-tested per token)
+    supported_cases = frozenset({"Nom", "Erg", "Dat", "Gen", "Inst", "Adv"})
+    supported_argument_patterns = frozenset({"<S>", "<S-DO>", "<S-IO>", "<S-DO-IO>"})
+    auxiliary_markers = frozenset({"<AuxIntr>", "<AuxTrans>", "<AuxTransHum>"})
+    modifier_markers = frozenset({"<Advb>", "<MWE>", "<Null>"})
+
     def __init__(self):
         # Define color mappings for different component types - using existing CSS classes
         self.color_mapping = {
@@ -60,12 +77,12 @@ class BaseGlossParser:
             "preverb": ["Pv"],
             "auxiliary": ["AuxIntr", "AuxTrans", "AuxTransHum"],
         }
-
-        # Supported cases and patterns
-        self.supported_cases = ["Nom", "Erg", "Dat", "Gen", "Inst", "Adv"]
-        self.supported_argument_patterns = ["<S>", "<S-DO>", "<S-IO>", "<S-DO-IO>"]
-        self.auxiliary_markers = ["<AuxIntr>", "<AuxTrans>", "<AuxTransHum>"]
-        self.modifier_markers = ["<Advb>", "<MWE>", "<Null>"]
+        # Flattened token -> component type table for single-lookup classification
+        self._component_type_lookup = {
+            pattern: component_type
+            for component_type, patterns in reversed(self.component_patterns.items())
+            for pattern in patterns
+        }
 
     def _split_components(self, raw_gloss: str) -> List[str]:
         """Split raw gloss into individual components."""
@@ -73,29 +90,24 @@ class BaseGlossParser:
             return []
         return raw_gloss.strip().split()
 
-    def _validate_basic_format(self, raw_gloss: str) -> bool:
+    @staticmethod
+    def _validate_basic_format(raw_gloss: str) -> bool:
         """Validate basic gloss format."""
-        if not raw_gloss or not raw_gloss.strip():
-            return False
-
-        parts = raw_gloss.strip().split()
-        if len(parts) < 1:
-            return False
-
-        # First part should be "V"
-        if parts[0] != "V":
+        if not raw_gloss:
             return False
 
-        return True
+        # First part should be "V"; only the leading token needs splitting off
+        parts = raw_gloss.split(None, 1)
+        return bool(parts) and parts[0] == "V"
 
     def _classify_component(self, component: str) -> str:
         """Classify a component based on its content."""
-        for component_type, patterns in self.component_patterns.items():
-            if component in patterns:
-                return component_type
+        component_type = self._component_type_lookup.get(component)
+        if component_type is not None:
+            return component_type
 
         # Check for special patterns
-        if component.startswith("<") and component.endswith(">"):
+        if component[:1] == "<" and component[-1:] == ">":
             if ":" in component:
                 return "case_spec"
             elif (
@@ -109,57 +121,61 @@ class BaseGlossParser:
         # Default to unknown
         return "unknown"
 
-    def _get_case_color(self, case_spec: str) -> str:
+    @staticmethod
+    def _get_case_color(case_spec: str) -> str:
         """Get appropriate color class for case specifications."""
-        if case_spec.startswith("<S:"):
-            return "gloss-subject"
-        elif case_spec.startswith("<DO:"):
-            return "gloss-direct-object"
-        elif case_spec.startswith("<IO:"):
-            return "gloss-indirect-object"
-        else:
+        role, colon, _ = case_spec.partition(":")
+        if not colon:
             return "gloss-case"
+        return _CASE_ROLE_COLORS.get(role, "gloss-case")
 
     def _is_argument_pattern(self, component: str) -> bool:
         """Check if a component is an argument pattern."""
         return (
-            component.startswith("<")
-            and component.endswith(">")
+            component[:1] == "<"
+            and component[-1:] == ">"
             and ":" not in component
             and component not in self.modifier_markers
             and component not in self.auxiliary_markers
         )
 
-    def _is_case_specification(self, component: str) -> bool:
+    @staticmethod
+    def _is_case_specification(component: str) -> bool:
         """Check if a component is a case specification."""
         return (
-            component.startswith("<") and component.endswith(">") and ":" in component
+            component[:1] == "<" and component[-1:] == ">" and ":" in component
         )
 
 
-# Shared constants
-TENSE_MAPPING = {
-    "present": "Pres",
-    "imperfect": "Impf",
-    "future": "Fut",
-    "aorist": "Aor",
-    "optative": "Opt",
-    "imperative": "Impv",
-}
-
-REVERSE_TENSE_MAPPING = {v: k for k, v in TENSE_MAPPING.items()}
-
-CASE_NAMES = {
-    "nom": "Nominative",
-    "erg": "Ergative",
-    "dat": "Dative",
-    "gen": "Genitive",
-    "inst": "Instrumental",
-    "adv": "Adverbial",
-}
-
-ROLE_DESCRIPTIONS = {
-    "subject": "Subject",
-    "direct_object": "Direct Object",
-    "indirect_object": "Indirect Object",
-}
+# Shared constants - read-only views so every consumer shares one table
+TENSE_MAPPING = MappingProxyType(
+    {
+        "present": "Pres",
+        "imperfect": "Impf",
+        "future": "Fut",
+        "aorist": "Aor",
+        "optative": "Opt",
+        "imperative": "Impv",
+    }
+)
+
+REVERSE_TENSE_MAPPING = MappingProxyType({v: k for k, v in TENSE_MAPPING.items()})
+
+CASE_NAMES = MappingProxyType(
+    {
+        "nom": "Nominative",
+        "erg": "Ergative",
+        "dat": "Dative",
+        "gen": "Genitive",
+        "inst": "Instrumental",
+        "adv": "Adverbial",
+    }
+)
+
+ROLE_DESCRIPTIONS = MappingProxyType(
+    {
+        "subject": "Subject",
+        "direct_object": "Direct Object",
+        "indirect_object": "Indirect Object",
+    }
+)
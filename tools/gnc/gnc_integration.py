@@ -7,12 +7,36 @@ for automatic raw gloss generation and argument pattern detection in the verb ed
 """
 
 import requests
-import json
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+
+# Shared GNC API plumbing; the relative form applies when imported as part of
+# the tools.gnc package, the plain one when run as a script from this directory
+try:
+    from .gnc_parser_utility import (
+        BATCH_REQUEST_TIMEOUT,
+        REQUEST_TIMEOUT,
+        GNCSession,
+        create_http_session,
+        extract_token_analysis,
+        open_persistent_cache,
+        parse_response_json,
+    )
+except ImportError:
+    from gnc_parser_utility import (
+        BATCH_REQUEST_TIMEOUT,
+        REQUEST_TIMEOUT,
+        GNCSession,
+        create_http_session,
+        extract_token_analysis,
+        open_persistent_cache,
+        parse_response_json,
+    )
 
 
 class Tense(Enum):
@@ -50,34 +74,70 @@ class GNCAnalysis:
     error_message: Optional[str] = None
 
 
+# All ArgumentPattern values as one alternation, so a single scan finds
+# whichever pattern the features string carries
+_ARGUMENT_PATTERN_RE = re.compile(r"<S(?:-DO(?:-IO)?|-IO)?>")
+
+# Tense abbreviation for each lowercase tense name (e.g. "present" -> "Pres")
+_TENSE_ABBREVIATIONS = {tense.name.lower(): tense.value for tense in Tense}
+
+# ArgumentPattern members keyed by their marker text
+_ARGUMENT_PATTERNS_BY_VALUE = {pattern.value: pattern for pattern in ArgumentPattern}
+
+# Every feature parse_features extracts, as one alternation scanned once:
+# tense and voice must be whole whitespace-separated tokens, while argument
+# patterns and case markers are found anywhere in the string
+_FEATURES_RE = re.compile(
+    r"(?<!\S)(?:(?P<tense>"
+    + "|".join(tense.value for tense in Tense)
+    + r")|(?P<voice>MedAct|MedPass|Act|Pass))(?!\S)"
+    r"|(?P<argument_pattern><S(?:-DO(?:-IO)?|-IO)?>)"
+    r"|<(?P<role>S|DO|IO):(?P<case>[A-Za-z]+)>"
+)
+
+# Case marker key for each role abbreviation in a <Role:Case> marker
+_CASE_MARKER_ROLES = {"S": "subject", "DO": "direct_object", "IO": "indirect_object"}
+
+
+@lru_cache(maxsize=4096)
+def _scan_features(
+    features: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str], Tuple[Tuple[str, str], ...]]:
+    """Extract tense, voice, argument pattern and case markers in one scan
+
+    Keeps the first occurrence of each. Many word forms share a features
+    string, so results are memoized; case markers come back as key/value
+    pairs so the cached value stays immutable.
+    """
+    tense = None
+    voice = None
+    argument_pattern = None
+    case_markers = {}
+    for match in _FEATURES_RE.finditer(features):
+        kind = match.lastgroup
+        if kind == "tense":
+            if tense is None:
+                tense = match.group(kind)
+        elif kind == "voice":
+            if voice is None:
+                voice = match.group(kind)
+        elif kind == "argument_pattern":
+            if argument_pattern is None:
+                argument_pattern = match.group(kind)
+        else:
+            case_markers.setdefault(
+                _CASE_MARKER_ROLES[match.group("role")], match.group("case")
+            )
+
+    return tense, voice, argument_pattern, tuple(case_markers.items())
+
+
 class GNCFeatureParser:
     """Parser for GNC morphological features"""
 
     def __init__(self):
         # Tense mapping for validation
-        self.tense_mapping = {
-            "present": Tense.PRESENT.value,
-            "imperfect": Tense.IMPERFECT.value,
-            "future": Tense.FUTURE.value,
-            "aorist": Tense.AORIST.value,
-            "optative": Tense.OPTATIVE.value,
-            "imperative": Tense.IMPERATIVE.value,
-        }
-
-        # Argument pattern regex patterns
-        self.argument_patterns = {
-            ArgumentPattern.SUBJECT_ONLY: r"<S>",
-            ArgumentPattern.SUBJECT_DIRECT_OBJECT: r"<S-DO>",
-            ArgumentPattern.SUBJECT_INDIRECT_OBJECT: r"<S-IO>",
-            ArgumentPattern.SUBJECT_DIRECT_INDIRECT_OBJECT: r"<S-DO-IO>",
-        }
-
-        # Case marker patterns
-        self.case_patterns = {
-            "subject": r"<S:([A-Za-z]+)>",
-            "direct_object": r"<DO:([A-Za-z]+)>",
-            "indirect_object": r"<IO:([A-Za-z]+)>",
-        }
+        self.tense_mapping = _TENSE_ABBREVIATIONS
 
     def parse_features(self, features: str) -> GNCAnalysis:
         """Parse GNC features string into structured analysis"""
@@ -90,29 +150,7 @@ class GNCFeatureParser:
                 error_message="No features provided",
             )
 
-        # Extract basic components
-        parts = features.split()
-
-        # Extract tense
-        tense = None
-        for part in parts:
-            if part in [t.value for t in Tense]:
-                tense = part
-                break
-
-        # Extract voice
-        voice = None
-        voice_patterns = ["MedAct", "Act", "Pass", "MedPass"]
-        for part in parts:
-            if part in voice_patterns:
-                voice = part
-                break
-
-        # Extract argument pattern
-        argument_pattern = self._extract_argument_pattern(features)
-
-        # Extract case markers
-        case_markers = self._extract_case_markers(features)
+        tense, voice, argument_pattern, case_markers = _scan_features(features)
 
         return GNCAnalysis(
             word="",  # Will be set by caller
@@ -121,28 +159,10 @@ class GNCFeatureParser:
             tense=tense,
             voice=voice,
             argument_pattern=argument_pattern,
-            case_markers=case_markers,
+            case_markers=dict(case_markers),
             is_valid=True,
         )
 
-    def _extract_argument_pattern(self, features: str) -> Optional[str]:
-        """Extract argument pattern from features string"""
-        for pattern_enum, pattern_regex in self.argument_patterns.items():
-            if re.search(pattern_regex, features):
-                return pattern_enum.value
-        return None
-
-    def _extract_case_markers(self, features: str) -> Dict[str, str]:
-        """Extract case markers from features string"""
-        case_markers = {}
-
-        for arg_type, pattern in self.case_patterns.items():
-            match = re.search(pattern, features)
-            if match:
-                case_markers[arg_type] = match.group(1)
-
-        return case_markers
-
     def generate_raw_gloss(self, analysis: GNCAnalysis, expected_tense: str) -> str:
         """Generate raw gloss from GNC analysis"""
         if not analysis.is_valid or not analysis.tense or not analysis.voice:
@@ -173,21 +193,26 @@ class GNCFeatureParser:
 
     def get_argument_pattern_enum(self, pattern: str) -> Optional[ArgumentPattern]:
         """Convert string pattern to enum"""
-        for enum_val in ArgumentPattern:
-            if enum_val.value == pattern:
-                return enum_val
-        return None
+        return _ARGUMENT_PATTERNS_BY_VALUE.get(pattern)
 
 
 class GNCIntegration:
     """Main integration class for GNC API with verb editor"""
 
-    def __init__(self, base_url: str = "http://gnc.gov.ge/gnc/parse-api"):
+    def __init__(
+        self,
+        base_url: str = "http://gnc.gov.ge/gnc/parse-api",
+        cache_path: Optional[Path] = None,
+    ):
         self.base_url = base_url
-        self.session_id: Optional[str] = None
-        self.session_timeout = 300  # 5 minutes
-        self.last_session_time = 0
         self.cache = {}
+        # GNC responses persisted across runs when the caller opts in with a
+        # cache_path (e.g. gnc_parser_utility.DEFAULT_CACHE_PATH); None keeps
+        # caching in memory only
+        self._persistent_cache = open_persistent_cache(cache_path)
+        self._session = create_http_session()
+        # Tenses are analyzed concurrently; the shared session refreshes only once
+        self._gnc_session = GNCSession(base_url, self._session)
         self.parser = GNCFeatureParser()
 
         # Forms to use for GNC analysis for each tense
@@ -200,43 +225,45 @@ class GNCIntegration:
             "imperative": "2sg",  # Use 2sg for imperative (fallback to 2pl if needed)
         }
 
-    def _get_session(self) -> bool:
-        """Get a new session ID from the API"""
-        try:
-            response = requests.get(f"{self.base_url}?command=get-session", timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            self.session_id = data.get("session-id")
-            self.last_session_time = time.time()
-
-            return bool(self.session_id)
+    @property
+    def session_id(self) -> Optional[str]:
+        """Current GNC API session id"""
+        return self._gnc_session.session_id
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting GNC session: {e}")
-            return False
+    def _get_cached_analysis(self, verb_form: str) -> Optional[GNCAnalysis]:
+        """Look a verb form up in memory, then in responses saved by earlier runs"""
+        if verb_form in self.cache:
+            return self.cache[verb_form]
 
-    def _ensure_session(self) -> bool:
-        """Ensure there is a valid session"""
-        current_time = time.time()
+        if self._persistent_cache is not None:
+            token = self._persistent_cache.get(verb_form)
+            if token is not None:
+                analysis = self._extract_analysis({"tokens": [token]}, verb_form)
+                if analysis and analysis.is_valid:
+                    self.cache[verb_form] = analysis
+                    return analysis
 
-        if (
-            not self.session_id
-            or current_time - self.last_session_time > self.session_timeout
-        ):
-            return self._get_session()
+        return None
 
-        return True
+    def _cache_analysis(
+        self, verb_form: str, token: Dict[str, Any], analysis: Optional[GNCAnalysis]
+    ):
+        """Cache a valid analysis in memory and persist its response token"""
+        if analysis and analysis.is_valid:
+            self.cache[verb_form] = analysis
+            if self._persistent_cache is not None:
+                self._persistent_cache.set(verb_form, token)
 
     def analyze_verb_form(self, verb_form: str) -> Optional[GNCAnalysis]:
         """Analyze a single verb form using GNC API"""
 
         # Check cache first
-        if verb_form in self.cache:
-            return self.cache[verb_form]
+        analysis = self._get_cached_analysis(verb_form)
+        if analysis is not None:
+            return analysis
 
         # Ensure there is  a valid session
-        if not self._ensure_session():
+        if not self._gnc_session.ensure():
             return None
 
         try:
@@ -244,16 +271,18 @@ class GNCIntegration:
             parse_url = f"{self.base_url}?command=parse&session-id={self.session_id}"
             parse_data = {"text": verb_form}
 
-            response = requests.post(parse_url, data=parse_data, timeout=10)
+            response = self._session.post(
+                parse_url, data=parse_data, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            result = response.json()
+            result = parse_response_json(response)
 
             # Extract analysis
             analysis = self._extract_analysis(result, verb_form)
 
             # Cache the result
-            if analysis and analysis.is_valid:
-                self.cache[verb_form] = analysis
+            if analysis:
+                self._cache_analysis(verb_form, result["tokens"][0], analysis)
 
             return analysis
 
@@ -261,21 +290,64 @@ class GNCIntegration:
             print(f"Error analyzing verb form '{verb_form}': {e}")
             return None
 
+    def analyze_verb_forms(
+        self, verb_forms: List[str]
+    ) -> Dict[str, Optional[GNCAnalysis]]:
+        """Analyze several verb forms with a single parse request
+
+        Uncached forms are sent together as one space-separated text and the
+        returned tokens are paired back with the forms by their word. Forms
+        missing from the result (request failure, or a response that does not
+        line up with the forms) are left for analyze_verb_form to retry.
+        """
+        analyses = {}
+        pending = []
+        for verb_form in dict.fromkeys(verb_forms):
+            analysis = self._get_cached_analysis(verb_form)
+            if analysis is not None:
+                analyses[verb_form] = analysis
+            elif verb_form and len(verb_form.split()) == 1:
+                pending.append(verb_form)
+
+        if not pending or not self._gnc_session.ensure():
+            return analyses
+
+        try:
+            parse_url = f"{self.base_url}?command=parse&session-id={self.session_id}"
+            parse_data = {"text": " ".join(pending)}
+
+            response = self._session.post(
+                parse_url, data=parse_data, timeout=BATCH_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            result = parse_response_json(response)
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error analyzing verb forms {pending}: {e}")
+            return analyses
+
+        tokens = result.get("tokens") or []
+        if len(tokens) != len(pending) or any(
+            token.get("word") != verb_form for token, verb_form in zip(tokens, pending)
+        ):
+            return analyses
+
+        for verb_form, token in zip(pending, tokens):
+            analysis = self._extract_analysis({"tokens": [token]}, verb_form)
+            self._cache_analysis(verb_form, token, analysis)
+            analyses[verb_form] = analysis
+
+        return analyses
+
     def _extract_analysis(
         self, result: Dict[str, Any], verb_form: str
     ) -> Optional[GNCAnalysis]:
         """Extract analysis from GNC API response"""
-        if "tokens" not in result or not result["tokens"]:
+        token_analysis = extract_token_analysis(result)
+        if token_analysis is None:
             return None
 
-        token = result["tokens"][0]
-        if "msa" not in token or not token["msa"]:
-            return None
-
-        # Get the first analysis (most likely)
-        msa = token["msa"][0]
-        lemma = msa.get("lemma", "")
-        features = msa.get("features", "")
+        lemma, features, _ = token_analysis
 
         # Parse features
         analysis = self.parser.parse_features(features)
@@ -285,12 +357,25 @@ class GNCIntegration:
         return analysis
 
     def generate_raw_gloss_for_tense(
-        self, conjugations: Dict[str, str], tense: str
+        self,
+        conjugations: Dict[str, str],
+        tense: str,
+        analyses: Optional[Dict[str, Optional[GNCAnalysis]]] = None,
     ) -> Tuple[str, Optional[str]]:
-        """Generate raw gloss for a specific tense using appropriate form"""
+        """Generate raw gloss for a specific tense using appropriate form
+
+        analyses holds results already fetched by analyze_verb_forms; forms
+        missing from it are analyzed individually.
+        """
+
+        def analyze(form: str) -> Optional[GNCAnalysis]:
+            if analyses is not None and form in analyses:
+                return analyses[form]
+            return self.analyze_verb_form(form)
 
         # Get the appropriate form for the tense
-        person_key = self.tense_analysis_forms.get(tense.lower())
+        tense_key = tense.lower()
+        person_key = self.tense_analysis_forms.get(tense_key)
         if not person_key or person_key not in conjugations:
             return "", f"No {person_key} form available for analysis"
 
@@ -299,9 +384,9 @@ class GNCIntegration:
             return "", f"{person_key} form is empty"
 
         # Special handling for imperative: try 2sg first, then 2pl if needed
-        if tense.lower() == "imperative" and person_key == "2sg":
+        if tense_key == "imperative" and person_key == "2sg":
             # Try 2sg first
-            analysis = self.analyze_verb_form(verb_form)
+            analysis = analyze(verb_form)
             if analysis and analysis.is_valid:
                 raw_gloss = self.parser.generate_raw_gloss(analysis, tense)
                 if raw_gloss:
@@ -310,14 +395,14 @@ class GNCIntegration:
             # If 2sg failed, try 2pl
             if "2pl" in conjugations and conjugations["2pl"]:
                 verb_form_2pl = conjugations["2pl"]
-                analysis_2pl = self.analyze_verb_form(verb_form_2pl)
+                analysis_2pl = analyze(verb_form_2pl)
                 if analysis_2pl and analysis_2pl.is_valid:
                     raw_gloss_2pl = self.parser.generate_raw_gloss(analysis_2pl, tense)
                     if raw_gloss_2pl:
                         return raw_gloss_2pl, None
 
         # Standard analysis for other tenses
-        analysis = self.analyze_verb_form(verb_form)
+        analysis = analyze(verb_form)
         if not analysis:
             return "", "Failed to analyze verb form"
 
@@ -337,11 +422,8 @@ class GNCIntegration:
             return None
 
         # Extract argument pattern from raw gloss
-        for pattern_enum in ArgumentPattern:
-            if pattern_enum.value in raw_gloss:
-                return pattern_enum.value
-
-        return None
+        match = _ARGUMENT_PATTERN_RE.search(raw_gloss)
+        return match.group(0) if match else None
 
     def process_verb_conjugations(
         self, conjugations_data: Dict[str, Dict[str, str]]
@@ -357,9 +439,35 @@ class GNCIntegration:
             "auto_generated": True,
         }
 
-        # Process each tense
+        # Fetch every form the tenses need with one batched parse request
+        verb_forms = []
         for tense, conjugations in conjugations_data.items():
-            raw_gloss, error = self.generate_raw_gloss_for_tense(conjugations, tense)
+            tense_key = tense.lower()
+            person_key = self.tense_analysis_forms.get(tense_key)
+            if person_key and conjugations.get(person_key):
+                verb_forms.append(conjugations[person_key])
+            if tense_key == "imperative" and conjugations.get("2pl"):
+                verb_forms.append(conjugations["2pl"])
+        analyses = self.analyze_verb_forms(verb_forms)
+
+        # Forms the batch could not resolve each wait on their own API round-trip,
+        # so build the tenses concurrently, then collect the results in tense order
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [
+                (
+                    tense,
+                    executor.submit(
+                        self.generate_raw_gloss_for_tense,
+                        conjugations,
+                        tense,
+                        analyses,
+                    ),
+                )
+                for tense, conjugations in conjugations_data.items()
+            ]
+
+        for tense, future in futures:
+            raw_gloss, error = future.result()
 
             if raw_gloss:
                 results["raw_glosses"][tense] = raw_gloss
@@ -386,18 +494,32 @@ class GNCIntegration:
             f"of the query results."
         )
 
+    def close(self):
+        """Release the pooled HTTP connections and the persistent cache"""
+        self._session.close()
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+
     def clear_cache(self):
-        """Clear the analysis cache"""
+        """Clear the in-memory analysis cache"""
         self.cache.clear()
 
+    def clear_persistent_cache(self):
+        """Delete the responses saved to the persistent cache by earlier runs"""
+        if self._persistent_cache is not None:
+            self._persistent_cache.clear()
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
             "cached_forms": len(self.cache),
-            "session_id": self.session_id,
-            "session_age": (
-                time.time() - self.last_session_time if self.session_id else None
+            "persisted_forms": (
+                len(self._persistent_cache)
+                if self._persistent_cache is not None
+                else 0
             ),
+            "session_id": self.session_id,
+            "session_age": self._gnc_session.age(),
         }
 
 
@@ -440,6 +562,9 @@ def integrate_with_verb_editor(
             "fallback_instructions": gnc.get_fallback_instructions("verb_form"),
         }
 
+    finally:
+        gnc.close()
+
 
 def test_integration():
     """Test the GNC integration"""
@@ -7,10 +7,24 @@ A utility class for using  Georgian National Corpus parsing API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import sqlite3
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from pathlib import Path
+
+# orjson decodes API responses several times faster; it is optional, so fall
+# back to the standard library when it isn't installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 @dataclass
@@ -29,46 +43,209 @@ class MorphologicalAnalysis:
     analysis_count: int = 0
 
 
-class GNCParserUtility:
-    """Utility class for GNC API integration"""
+# Feature tokens recognized by _parse_features
+_PARTS_OF_SPEECH = {
+    "V": "Verb",
+    "N": "Noun",
+    "Adj": "Adjective",
+    "Adv": "Adverb",
+    "Interj": "Interjection",
+}
+_TENSES = frozenset({"Pres", "Past", "Fut"})
+_VOICES = frozenset({"MedAct", "Act", "Pass"})
+_CASE_MARKER_PREFIXES = ("<S:", "<DO:", "<IO:")
+
+
+# (connect, read) timeouts in seconds: fail fast on a stalled server and let
+# the session's retry policy try again; multi-word parses get longer to read
+REQUEST_TIMEOUT = (3, 7)
+BATCH_REQUEST_TIMEOUT = (3, 12)
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled keep-alive session for repeated GNC API calls"""
+    session = requests.Session()
+    # Parse requests are POSTs but have no side effects, so they are retried too
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Default location of the persistent GNC response cache, shared across runs
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / ".cache" / "gnc_cache.sqlite"
+
+
+class PersistentResponseCache:
+    """SQLite store of GNC parse tokens keyed by word, kept between runs"""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (word TEXT PRIMARY KEY, token TEXT)"
+        )
+
+    def get(self, word: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT token FROM responses WHERE word = ?", (word,)
+            ).fetchone()
+        return _json_loads(row[0]) if row else None
+
+    def set(self, word: str, token: Dict[str, Any]):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (word, token) VALUES (?, ?)",
+                (word, json.dumps(token, ensure_ascii=False)),
+            )
 
-    def __init__(self, base_url: str = "http://gnc.gov.ge/gnc/parse-api"):
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def open_persistent_cache(
+    cache_path: Optional[Path],
+) -> Optional[PersistentResponseCache]:
+    """Open the persistent cache, falling back to memory-only caching on failure"""
+    if cache_path is None:
+        return None
+    try:
+        return PersistentResponseCache(cache_path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error opening GNC cache '{cache_path}': {e}")
+        return None
+
+
+def parse_response_json(response: requests.Response) -> Any:
+    """Decode a GNC API response body as JSON"""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        # Surface malformed replies as request errors, as response.json() does
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in GNC response: {e}", response=response
+        ) from e
+
+
+class GNCSession:
+    """GNC API session id, refreshed when it expires
+
+    Shared by the GNC clients. Refreshes use double-checked locking so
+    concurrent callers trigger a single get-session request.
+    """
+
+    def __init__(
+        self, base_url: str, http_session: requests.Session, timeout: float = 300
+    ):
         self.base_url = base_url
+        self.http_session = http_session
+        self.timeout = timeout  # 5 minutes
         self.session_id: Optional[str] = None
-        self.session_timeout = 300  # 5 minutes
-        self.last_session_time = 0
-        self.cache = {}  # Simple cache for parsed words
+        self.last_session_time = 0.0
+        self._lock = threading.Lock()
+
+    def _is_current(self) -> bool:
+        return bool(self.session_id) and (
+            time.time() - self.last_session_time <= self.timeout
+        )
+
+    def ensure(self) -> bool:
+        """Ensure there is a valid session, fetching a new one if needed"""
+        if self._is_current():
+            return True
 
-    def _get_session(self) -> bool:
+        with self._lock:
+            if self._is_current():
+                return True
+            return self._refresh()
+
+    def _refresh(self) -> bool:
         """Get a new session ID from the API"""
         try:
-            response = requests.get(f"{self.base_url}?command=get-session", timeout=10)
+            response = self.http_session.get(
+                f"{self.base_url}?command=get-session", timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            data = response.json()
+            data = parse_response_json(response)
 
             self.session_id = data.get("session-id")
             self.last_session_time = time.time()
 
-            if self.session_id:
-                return True
-            return False
+            return bool(self.session_id)
 
         except requests.exceptions.RequestException as e:
-            print(f"Error getting session: {e}")
+            print(f"Error getting GNC session: {e}")
             return False
 
-    def _ensure_session(self) -> bool:
-        """Ensure there is a valid session"""
-        current_time = time.time()
+    def age(self) -> Optional[float]:
+        """Seconds since the current session was fetched, if there is one"""
+        return time.time() - self.last_session_time if self.session_id else None
+
+
+def extract_token_analysis(result: Dict[str, Any]) -> Optional[Tuple[str, str, int]]:
+    """Get (lemma, features, analysis count) for the first token of a parse response
+
+    The first morphological analysis is the most likely one. Returns None
+    when the response has no tokens or the token has no analyses.
+    """
+    tokens = result.get("tokens")
+    if not tokens:
+        return None
 
-        # Check if session is expired or doesn't exist
-        if (
-            not self.session_id
-            or current_time - self.last_session_time > self.session_timeout
-        ):
-            return self._get_session()
+    msa = tokens[0].get("msa")
+    if not msa:
+        return None
 
-        return True
+    analysis_count = len(msa) if isinstance(msa, list) else 0
+    return msa[0].get("lemma", ""), msa[0].get("features", ""), analysis_count
+
+
+class GNCParserUtility:
+    """Utility class for GNC API integration"""
+
+    def __init__(
+        self,
+        base_url: str = "http://gnc.gov.ge/gnc/parse-api",
+        cache_path: Optional[Path] = None,
+    ):
+        self.base_url = base_url
+        self.cache = {}  # Simple cache for parsed words
+        # GNC responses persisted across runs when the caller opts in with a
+        # cache_path (e.g. DEFAULT_CACHE_PATH); None keeps caching in memory only
+        self._persistent_cache = open_persistent_cache(cache_path)
+        self._session = create_http_session()
+        self._gnc_session = GNCSession(base_url, self._session)
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """Current GNC API session id"""
+        return self._gnc_session.session_id
 
     def parse_word(
         self, word: str, use_cache: bool = True
@@ -79,8 +256,17 @@ class GNCParserUtility:
         if use_cache and word in self.cache:
             return self.cache[word]
 
+        # Then reuse a response saved by an earlier run
+        if use_cache and self._persistent_cache is not None:
+            token = self._persistent_cache.get(word)
+            if token is not None:
+                analysis = self._extract_analysis({"tokens": [token]}, word)
+                if analysis:
+                    self.cache[word] = analysis
+                    return analysis
+
         # Ensure there is a valid session
-        if not self._ensure_session():
+        if not self._gnc_session.ensure():
             return None
 
         try:
@@ -88,9 +274,11 @@ class GNCParserUtility:
             parse_url = f"{self.base_url}?command=parse&session-id={self.session_id}"
             parse_data = {"text": word}
 
-            response = requests.post(parse_url, data=parse_data, timeout=10)
+            response = self._session.post(
+                parse_url, data=parse_data, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            result = response.json()
+            result = parse_response_json(response)
 
             # Extract analysis
             analysis = self._extract_analysis(result, word)
@@ -98,6 +286,8 @@ class GNCParserUtility:
             # Cache the result
             if use_cache and analysis:
                 self.cache[word] = analysis
+                if self._persistent_cache is not None:
+                    self._persistent_cache.set(word, result["tokens"][0])
 
             return analysis
 
@@ -107,16 +297,18 @@ class GNCParserUtility:
 
     def parse_sentence(self, sentence: str) -> List[MorphologicalAnalysis]:
         """Parse a Georgian sentence"""
-        if not self._ensure_session():
+        if not self._gnc_session.ensure():
             return []
 
         try:
             parse_url = f"{self.base_url}?command=parse&session-id={self.session_id}"
             parse_data = {"text": sentence}
 
-            response = requests.post(parse_url, data=parse_data, timeout=15)
+            response = self._session.post(
+                parse_url, data=parse_data, timeout=BATCH_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            result = response.json()
+            result = parse_response_json(response)
 
             analyses = []
             if "tokens" in result:
@@ -137,18 +329,11 @@ class GNCParserUtility:
         self, result: Dict[str, Any], word: str
     ) -> Optional[MorphologicalAnalysis]:
         """Extract morphological analysis from API response"""
-        if "tokens" not in result or not result["tokens"]:
-            return None
-
-        token = result["tokens"][0]
-        if "msa" not in token or not token["msa"]:
+        token_analysis = extract_token_analysis(result)
+        if token_analysis is None:
             return None
 
-        # Get the first analysis (most likely)
-        msa = token["msa"][0]
-        analysis_count = len(token["msa"]) if isinstance(token.get("msa"), list) else 0
-        lemma = msa.get("lemma", "")
-        features = msa.get("features", "")
+        lemma, features, analysis_count = token_analysis
 
         # Parse features
         parsed_features = self._parse_features(features)
@@ -177,27 +362,16 @@ class GNCParserUtility:
         feature_parts = features.split()
 
         for part in feature_parts:
-            if part == "V":
-                parsed["pos"] = "Verb"
-            elif part == "N":
-                parsed["pos"] = "Noun"
-            elif part == "Adj":
-                parsed["pos"] = "Adjective"
-            elif part == "Adv":
-                parsed["pos"] = "Adverb"
-            elif part == "Interj":
-                parsed["pos"] = "Interjection"
-            elif part in ["Pres", "Past", "Fut"]:
+            pos = _PARTS_OF_SPEECH.get(part)
+            if pos is not None:
+                parsed["pos"] = pos
+            elif part in _TENSES:
                 parsed["tense"] = part
-            elif part in ["MedAct", "Act", "Pass"]:
+            elif part in _VOICES:
                 parsed["voice"] = part
             elif part.startswith("S:"):
                 parsed["person"] = part
-            elif part.startswith("<S:"):
-                parsed["case"] = part.strip("<>")
-            elif part.startswith("<DO:"):
-                parsed["case"] = part.strip("<>")
-            elif part.startswith("<IO:"):
+            elif part.startswith(_CASE_MARKER_PREFIXES):
                 parsed["case"] = part.strip("<>")
 
         return parsed
@@ -223,18 +397,32 @@ class GNCParserUtility:
         analysis = self.parse_word(word)
         return analysis is not None
 
+    def close(self):
+        """Release the pooled HTTP connections and the persistent cache"""
+        self._session.close()
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+
     def clear_cache(self):
-        """Clear the word cache"""
+        """Clear the in-memory word cache"""
         self.cache.clear()
 
+    def clear_persistent_cache(self):
+        """Delete the responses saved to the persistent cache by earlier runs"""
+        if self._persistent_cache is not None:
+            self._persistent_cache.clear()
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
             "cached_words": len(self.cache),
-            "session_id": self.session_id,
-            "session_age": (
-                time.time() - self.last_session_time if self.session_id else None
+            "persisted_words": (
+                len(self._persistent_cache)
+                if self._persistent_cache is not None
+                else 0
             ),
+            "session_id": self.session_id,
+            "session_age": self._gnc_session.age(),
         }
 
 
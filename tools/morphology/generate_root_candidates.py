@@ -117,6 +117,15 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Enable GNC parsing enrichment for each candidate lemma.",
     )
+    parser.add_argument(
+        "--gnc-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "When GNC is enabled, persist GNC responses in .cache/gnc_cache.sqlite "
+            "so repeat runs skip lemmas already parsed."
+        ),
+    )
     parser.add_argument(
         "--drop-not-found-on-gnc",
         action=argparse.BooleanOptionalAction,
@@ -273,15 +282,18 @@ def classify_pos_from_gnc_features(features: str) -> tuple[str, bool]:
     return "unspecified", False
 
 
-def maybe_init_gnc_parser(workspace_root: Path):
+def maybe_init_gnc_parser(workspace_root: Path, use_cache: bool = False):
     sys.path.insert(0, str(workspace_root.resolve()))
     try:
-        from tools.gnc.gnc_parser_utility import GNCParserUtility  # type: ignore
+        from tools.gnc.gnc_parser_utility import (  # type: ignore
+            DEFAULT_CACHE_PATH,
+            GNCParserUtility,
+        )
     except Exception as error:  # pragma: no cover - best effort import
         raise RuntimeError(
             "Failed to import GNCParserUtility. Check tools/gnc module availability."
         ) from error
-    return GNCParserUtility()
+    return GNCParserUtility(cache_path=DEFAULT_CACHE_PATH if use_cache else None)
 
 
 class NPLGDictionaryClient:
@@ -942,7 +954,11 @@ def main() -> None:
         raise FileNotFoundError(f"Missing ena records JSONL file: {ena_records_jsonl}")
     entries = extract_entries_from_ena_jsonl(ena_records_jsonl)
     source_files = [ena_records_jsonl]
-    gnc_parser = maybe_init_gnc_parser(workspace_root) if args.use_gnc else None
+    gnc_parser = (
+        maybe_init_gnc_parser(workspace_root, use_cache=args.gnc_cache)
+        if args.use_gnc
+        else None
+    )
     nplg_cache_path = (workspace_root / args.nplg_cache_json).resolve()
     nplg_client = (
         NPLGDictionaryClient(initial_cache=load_nplg_cache(nplg_cache_path))
@@ -1028,6 +1044,8 @@ def main() -> None:
 
     if nplg_client is not None:
         save_nplg_cache(nplg_cache_path, nplg_client.cache)
+    if gnc_parser is not None:
+        gnc_parser.close()
 
 
 if __name__ == "__main__":